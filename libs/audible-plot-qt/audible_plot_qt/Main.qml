@@ -27,6 +27,15 @@ ApplicationWindow {
                 } else if (event.key === Qt.Key_Return || event.key === Qt.Key_Enter) {
                     event.accepted = true;
                     window.play();
+                } else if ((event.key === Qt.Key_Left || event.key === Qt.Key_Right) && (event.modifiers & Qt.ControlModifier)) {
+                    event.accepted = true;
+                    // Jump to the previous or next event of this series
+                    var row = index;
+                    var found = event.key === Qt.Key_Left ? backend.previousEvent(row, position) : backend.nextEvent(row, position);
+                    if (found >= 0) {
+                        position = found;
+                        backend.window.getByPosition(row).scrub(found);
+                    }
                 } else if (event.key === Qt.Key_Left) {
                     event.accepted = true;
                     if (position == 0) {
@@ -34,6 +43,7 @@ ApplicationWindow {
                         return;
                     }
                     position = position - 1;
+                    series.scrub(position);
                 } else if (event.key == Qt.Key_Right) {
                     event.accepted = true;
                     if (position === series.size - 1) {
@@ -41,6 +51,7 @@ ApplicationWindow {
                         return;
                     }
                     position = position + 1;
+                    series.scrub(position);
                 }
             }
         }
@@ -0,0 +1,185 @@
+"""Headless latency benchmark for the keyboard navigation path.
+
+Loads ``Main.qml`` on the offscreen Qt platform against a large synthetic
+chart whose audio player captures buffers instead of playing them. Each
+scripted move presses an arrow key at the edge of the window, which moves
+the chart slice, and then Enter, which renders and plays the new window.
+The report gives p50/p99 times from the arrow key event to the first audio
+sample reaching the player, and the peak memory allocated per move. A last
+pass scrubs back and forth inside the window, timing point grains.
+
+    python -m audible_plot_qt.bench --rows 100000 --series 6 --moves 200
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+import audible_plot as ap
+import numpy as np
+
+qml_file = Path(__file__).parent / "Main.qml"
+
+
+class CapturingPlayer:
+    """Audio sink recording when buffers arrive instead of playing them.
+
+    It stands in for an `ap.AudioPlayer`, which only needs `play_raw` from
+    it, without opening an audio device.
+    """
+
+    def __init__(self, sample_rate: float = 44100) -> None:
+        self.sample_rate = sample_rate
+        self.first_sample_at: float | None = None
+        self.buffer_count = 0
+
+    def reset(self) -> None:
+        self.first_sample_at = None
+
+    def play_raw(self, buffer: ap.AudioBuffer) -> None:
+        if self.first_sample_at is None:
+            self.first_sample_at = time.perf_counter()
+        self.buffer_count += 1
+
+
+def build_chart(rows: int, series: int, player: CapturingPlayer) -> ap.AudibleChart:
+    rng = np.random.default_rng(0)
+    positions = np.arange(rows)
+    columns = []
+    config = []
+    for idx in range(series):
+        if idx % 2:
+            columns.append(np.sin(positions * (idx + 1) / 50))
+            value_range = ap.FixedRange(-1, 1)
+        else:
+            columns.append(np.cumsum(rng.normal(size=rows)))
+            value_range = None
+        config.append(
+            ap.SeriesConfig(
+                key=idx,
+                range=value_range,
+                renderer=ap.PitchDataRenderer(
+                    generator=ap.ToneGenerator(),
+                    enable_transitions=bool(idx % 2),
+                    pan=(idx / max(series - 1, 1)) * 2 - 1,
+                    volume=1 / series,
+                ),
+            )
+        )
+    return ap.AudibleChart(
+        data=np.column_stack(columns),
+        config=config,
+        frequency_range=ap.FixedRange(300, 800),
+        player=player,  # type: ignore
+    )
+
+
+def run(
+    rows: int, series: int, window: int, moves: int, duration: timedelta
+) -> dict[str, np.ndarray]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import Qt, QUrl
+    from PySide6.QtQml import QQmlApplicationEngine
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QApplication
+
+    from audible_plot_qt.chart import ChartBackend
+
+    app = QApplication.instance() or QApplication([])
+    player = CapturingPlayer()
+    backend = ChartBackend(
+        build_chart(rows, series, player),
+        initial_size=window,
+        duration=duration,
+        scrub_player=player,  # type: ignore
+    )
+    engine = QQmlApplicationEngine()
+    engine.rootContext().setContextProperty("backend", backend)
+    engine.load(QUrl(qml_file.as_uri()))
+    qml_window = engine.rootObjects()[0]
+    app.processEvents()
+
+    def move(key: Qt.Key, play: bool = True) -> float:
+        player.reset()
+        started = time.perf_counter()
+        QTest.keyClick(qml_window, key)
+        if play:
+            QTest.keyClick(qml_window, Qt.Key.Key_Return)
+        app.processEvents()
+        if player.first_sample_at is None:
+            raise RuntimeError("The move did not produce any audio.")
+        return player.first_sample_at - started
+
+    # The QML cursor starts at the first point of the window, so every left
+    # arrow press moves the slice one window back. Allocations are measured
+    # in a second pass, as tracing them slows everything down.
+    latencies = np.array([move(Qt.Key.Key_Left) for _ in range(moves)])
+
+    tracemalloc.start()
+    allocations = []
+    for _ in range(moves):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        move(Qt.Key.Key_Left)
+        allocations.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    # Moving the cursor right then left again stays within the window and
+    # plays the grain of the point under it.
+    scrubs = np.array(
+        [
+            move(Qt.Key.Key_Right if idx % 2 == 0 else Qt.Key.Key_Left, play=False)
+            for idx in range(moves)
+        ]
+    )
+
+    engine.deleteLater()
+    return {
+        "latency": latencies,
+        "allocations": np.array(allocations),
+        "scrub": scrubs,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--series", type=int, default=6)
+    parser.add_argument("--window", type=int, default=10)
+    parser.add_argument("--moves", type=int, default=200)
+    parser.add_argument("--duration-ms", type=float, default=500)
+    args = parser.parse_args()
+
+    results = run(
+        rows=args.rows,
+        series=args.series,
+        window=args.window,
+        moves=args.moves,
+        duration=timedelta(milliseconds=args.duration_ms),
+    )
+    latency = results["latency"] * 1000
+    allocations = results["allocations"] / 2**20
+    print(
+        f"{args.moves} moves, {args.rows} rows, {args.series} series, "
+        f"window of {args.window} points"
+    )
+    print(
+        f"key to first sample: p50 {np.percentile(latency, 50):.2f} ms, "
+        f"p99 {np.percentile(latency, 99):.2f} ms"
+    )
+    print(
+        f"allocated per move: p50 {np.percentile(allocations, 50):.2f} MiB, "
+        f"p99 {np.percentile(allocations, 99):.2f} MiB"
+    )
+    scrub = results["scrub"] * 1000
+    print(
+        f"scrub key to first sample: p50 {np.percentile(scrub, 50):.2f} ms, "
+        f"p99 {np.percentile(scrub, 99):.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import builtins
-from typing import Any, Dict, Hashable
+from datetime import timedelta
+from typing import Any, Dict, Hashable, Mapping
 
 import audible_plot as ap
+import numpy as np
 from PySide6.QtCore import (
     Property,
     QAbstractListModel,
@@ -69,6 +71,11 @@ class SeriesWindowBackend(QObject):
     def play(self):
         return self._chart_window.play_by_key(self._window.key)
 
+    @Slot(int)
+    def scrub(self, pos: int):
+        """Play the point at `pos` right away, cutting off any scrub sound."""
+        self._chart_window.scrub_by_key(self._window.key, pos)
+
     def get_size(self) -> int:
         return len(self._window)
 
@@ -85,10 +92,18 @@ class ChartWindowBackend(QAbstractListModel):
     def __init__(
         self,
         window: ap.AudibleChartWindow,
+        duration: timedelta = timedelta(seconds=0.5),
+        scrub_player: ap.AudioPlayer | None = None,
+        scrub_duration: timedelta = timedelta(milliseconds=80),
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self._window = window
+        self._duration = duration
+        self._scrub_player = scrub_player or window.player
+        self._scrub_duration = scrub_duration
+        # Pre-rendered point grains, by series key ("all" for the mix)
+        self._grains: dict[Hashable, np.ndarray] = {}
         self._series = [
             SeriesWindowBackend(window, self) for window in self._window.series
         ]
@@ -113,11 +128,37 @@ class ChartWindowBackend(QAbstractListModel):
         return {self.SeriesRole: b"series"}
 
     def play_by_key(self, key: Hashable):
-        self._window.play(key)
+        self._window.play(key, duration=self._duration)
 
     @Slot()
     def play(self):
-        return self._window.play()
+        return self._window.play(duration=self._duration)
+
+    def grains(self, key: Hashable = "all") -> np.ndarray:
+        grains = self._grains.get(key)
+        if grains is None:
+            grains = self._window.render_grains(key, self._scrub_duration)
+            self._grains[key] = grains
+        return grains
+
+    def scrub_by_key(self, key: Hashable, pos: int):
+        grains = self.grains(key)
+        if 0 <= pos < len(grains):
+            self._scrub_player.play_raw(grains[pos])
+
+    @Slot(int)
+    def scrub(self, pos: int):
+        """Play every series at `pos` right away, cutting off any scrub sound."""
+        self.scrub_by_key("all", pos)
+
+    @Slot(int, int)
+    def scrubAround(self, pos: int, radius: int):
+        """Play the points from `pos - radius` to `pos + radius` in a row."""
+        grains = self.grains()
+        start = max(pos - radius, 0)
+        stop = min(pos + radius + 1, len(grains))
+        if start < stop:
+            self._scrub_player.play_raw(np.concatenate(grains[start:stop]))
 
     @Slot(int, result=SeriesWindowBackend)
     def getByPosition(self, pos: int):
@@ -131,10 +172,21 @@ class ChartBackend(QObject):
         self,
         chart: ap.AudibleChart,
         initial_size: int = 10,
+        duration: timedelta = timedelta(seconds=0.5),
+        scrub_player: ap.AudioPlayer | None = None,
+        scrub_duration: timedelta = timedelta(milliseconds=80),
+        event_predicates: Mapping[Hashable, ap.EventPredicate] | None = None,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self._chart = chart
+        # Audio reused between the windows of this session only
+        self._sliding = chart.sliding_cache()
+        self._duration = duration
+        self._scrub_player = scrub_player
+        self._scrub_duration = scrub_duration
+        # Series without a predicate have their nonzero values as events
+        self._event_predicates = dict(event_predicates or {})
         self._slice = None
         position_end = len(chart)
         if len(chart) < initial_size:
@@ -161,9 +213,47 @@ class ChartBackend(QObject):
     @Property(QObject, notify=onSliceChanged)  # type: ignore
     def window(self):
         if not self._window:
-            self._window = ChartWindowBackend(self._chart.window(self.slice.slice))  # type: ignore
+            if self._scrub_player is None:
+                # Opened on first use, it keeps an output stream running
+                self._scrub_player = ap.GrainPlayer(self._chart.plan.sample_rate)
+            self._window = ChartWindowBackend(
+                self._chart.window(self.slice.slice, self._sliding),  # type: ignore
+                self._duration,
+                self._scrub_player,
+                self._scrub_duration,
+            )
         return self._window
 
+    @Slot(int, int, result=int)
+    def nextEvent(self, series: int, pos: int) -> int:
+        """Center the slice on the next event of the series at row `series`
+        after the cursor at `pos`, returning the event position in the new
+        window, or -1 if there are no more events."""
+        return self._jump_to_event(series, pos, forward=True)
+
+    @Slot(int, int, result=int)
+    def previousEvent(self, series: int, pos: int) -> int:
+        """Like `nextEvent`, for the previous event before the cursor."""
+        return self._jump_to_event(series, pos, forward=False)
+
+    def _jump_to_event(self, series: int, pos: int, forward: bool) -> int:
+        key = self._chart.series[series].key
+        current_slice: slice = self.slice.slice  # type: ignore
+        position = current_slice.start + pos
+        predicate = self._event_predicates.get(key)
+        if forward:
+            event = self._chart.next_event(key, position, predicate)
+        else:
+            event = self._chart.previous_event(key, position, predicate)
+        if event is None:
+            return -1
+
+        slice_size = current_slice.stop - current_slice.start
+        start = min(max(event - slice_size // 2, 0), len(self._chart) - slice_size)
+        if start != current_slice.start:
+            self._set_slice(slice(start, start + slice_size))
+        return event - start
+
     @Slot()
     def moveLeft(self):
         current_slice: slice = self.slice.slice  # type: ignore
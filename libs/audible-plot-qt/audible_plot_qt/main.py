@@ -9,7 +9,7 @@ from PySide6.QtWidgets import QApplication
 
 from audible_plot_qt.chart import ChartBackend
 
-qml_dir = Path(__file__, "..")
+qml_dir = Path(__file__).parent
 
 
 def build_chart():
@@ -1,3 +1,4 @@
+from .batch import AudibleChartBatch
 from .chart import (
     AudibleChart,
     AudibleChartWindow,
@@ -5,14 +6,34 @@ from .chart import (
     AudibleSeriesWindow,
     SeriesConfig,
 )
+from .diskcache import AudioDiskCache
+from .events import EventIndex, EventPredicate
 from .generators import AudioBuffer, ToneGenerator
-from .player import AudioPlayer
+from .plan import RenderPlan, SeriesPlan
+from .pool import ProcessPoolRenderer
+from .indicators import (
+    AroonIndicator,
+    CrossoverIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    RSIIndicator,
+    StreamingIndicator,
+)
+from .player import AudioPlayer, GrainPlayer, SampleFormat
 from .render import (
     AbstractDataRenderer,
+    Tones,
+    AmplitudeDataRenderer,
+    PanDataRenderer,
     PitchDataRenderer,
+    PulseDataRenderer,
     ConditionalRenderer,
     SilentRenderer,
 )
+from .runs import RunLengthColumn
+from .sliding import SlidingRenderCache
+from .streaming import StreamingChart
+from .timeline import EventSchedule, TimelineRenderer
 from .utils import (
     AbstractValueRange,
     DynamicValueRange,
@@ -29,14 +50,38 @@ __all__ = [
     "concat_samples",
     "AbstractDataRenderer",
     "PitchDataRenderer",
+    "AmplitudeDataRenderer",
+    "PulseDataRenderer",
+    "PanDataRenderer",
     "AudioBuffer",
     "ToneGenerator",
     "AudibleChart",
+    "AudibleChartBatch",
     "AudibleChartWindow",
     "AudibleSeries",
     "AudibleSeriesWindow",
     "AudioPlayer",
+    "AudioDiskCache",
+    "EventIndex",
+    "EventSchedule",
+    "EventPredicate",
+    "GrainPlayer",
+    "SampleFormat",
+    "ProcessPoolRenderer",
+    "RenderPlan",
+    "SeriesPlan",
     "SeriesConfig",
     "ConditionalRenderer",
+    "RunLengthColumn",
+    "SlidingRenderCache",
+    "StreamingChart",
+    "TimelineRenderer",
+    "Tones",
+    "StreamingIndicator",
+    "EMAIndicator",
+    "MACDIndicator",
+    "RSIIndicator",
+    "AroonIndicator",
+    "CrossoverIndicator",
     "SilentRenderer",
 ]
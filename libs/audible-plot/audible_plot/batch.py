@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from datetime import timedelta
+from typing import Literal
+
+import numpy as np
+
+from audible_plot import kernels
+from audible_plot.chart import AudibleChart
+from audible_plot.generators import AudioBuffer
+from audible_plot.plan import RenderPlan, SeriesPlan
+from audible_plot.render import SilentRenderer
+from audible_plot.utils import AbstractValueRange
+
+
+def _same_range(
+    first: AbstractValueRange | None, second: AbstractValueRange | None
+) -> bool:
+    if first is None or second is None:
+        return first is second
+    return (first.min_value, first.max_value) == (second.min_value, second.max_value)
+
+
+def _same_series(first: SeriesPlan, second: SeriesPlan) -> bool:
+    return (
+        first.key == second.key
+        and first.is_extra == second.is_extra
+        and first.voice == second.voice
+        and (
+            first.renderer is second.renderer
+            or type(first.renderer) is type(second.renderer) is SilentRenderer
+        )
+        and _same_range(first.value_range, second.value_range)
+        and _same_range(first.frequency_range, second.frequency_range)
+    )
+
+
+class AudibleChartBatch:
+    """Render the same window of many charts sharing one series configuration.
+
+    The charts must be built from the same `SeriesConfig` objects. Series
+    stored densely in every chart and rendered through channel gains are
+    stacked into two-dimensional arrays, so value mapping and synthesis run
+    once for all the charts; any other series is rendered chart by chart.
+    Charts whose windows have different lengths are rendered in groups of
+    equal length.
+    """
+
+    def __init__(self, charts: Sequence[AudibleChart]) -> None:
+        if not charts:
+            raise ValueError("A chart batch needs at least one chart.")
+        reference = charts[0].plan
+        for chart in charts[1:]:
+            plan = chart.plan
+            if (
+                plan.sample_rate != reference.sample_rate
+                or len(plan.series) != len(reference.series)
+                or not all(map(_same_series, plan.series, reference.series))
+            ):
+                raise TypeError(
+                    "All charts in a batch must share the same series configuration."
+                )
+        self._charts = list(charts)
+
+    @property
+    def charts(self) -> list[AudibleChart]:
+        return list(self._charts)
+
+    def __len__(self) -> int:
+        return len(self._charts)
+
+    def render(
+        self,
+        window_bounds: slice | None = None,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        position: slice | int | None = None,
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> list[AudioBuffer]:
+        """Render the same window of every chart, one buffer per chart."""
+        window_bounds = window_bounds or slice(None, None)
+        if isinstance(position, int):
+            position = slice(position, position + 1)
+
+        plans = [chart.plan for chart in self._charts]
+        groups: dict[int, list[int]] = {}
+        for idx, plan in enumerate(plans):
+            rows = range(len(plan))[window_bounds]
+            if position is not None:
+                rows = rows[position]
+            groups.setdefault(len(rows), []).append(idx)
+
+        buffers: list[AudioBuffer] = [None] * len(plans)  # type: ignore
+        for row_count, members in groups.items():
+            samples = self._render_aligned(
+                [plans[idx] for idx in members],
+                row_count,
+                window_bounds,
+                names,
+                position,
+                duration,
+            )
+            for idx, sample in zip(members, samples):
+                buffers[idx] = sample  # type: ignore
+        return buffers
+
+    def render_multichannel(
+        self,
+        window_bounds: slice | None = None,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        position: slice | int | None = None,
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> np.ndarray:
+        """Render every chart into one buffer with a stereo channel pair each.
+
+        Shorter renders are padded with silence at the end.
+        """
+        buffers = self.render(window_bounds, names, position, duration)
+        output = np.zeros((max(len(buffer) for buffer in buffers), 2 * len(buffers)))
+        for idx, buffer in enumerate(buffers):
+            output[: len(buffer), 2 * idx : 2 * idx + 2] = buffer
+        return output
+
+    def _render_aligned(
+        self,
+        plans: list[RenderPlan],
+        row_count: int,
+        bounds: slice,
+        names: Hashable | Sequence[Hashable] | Literal["all"],
+        position: slice | None,
+        duration: timedelta,
+    ) -> np.ndarray:
+        reference = plans[0]
+        sample_rate = reference.sample_rate
+        sample_size = int(duration.total_seconds() * sample_rate)
+        output = np.zeros((len(plans), row_count * sample_size, 2))
+        selected = [plan.select(names) for plan in plans]
+        if not selected[0] or not row_count:
+            return output
+
+        windows = [range(len(plan))[bounds] for plan in plans]
+        blocks = [plan.values[bounds] for plan in plans]
+        rows = blocks if position is None else [block[position] for block in blocks]
+        related = [None] * len(plans)
+        if any(not item.is_extra for item in selected[0]):
+            related = [
+                plan.related_range(block, window)
+                for plan, block, window in zip(plans, blocks, windows)
+            ]
+
+        fallback = []
+        for idx, item in enumerate(selected[0]):
+            items = [series[idx] for series in selected]
+            if item.renderer.is_silent or item.voice is not None:
+                continue
+            if (
+                item.channel_gains is None
+                or reference.modulators(item.key)
+                or any(series.runs is not None for series in items)
+            ):
+                fallback.append(idx)
+                continue
+
+            if not item.is_extra:
+                ranges = related
+            elif item.value_range is not None:
+                ranges = [item.value_range] * len(plans)
+            else:
+                ranges = [
+                    plan.value_range(series, block, window)
+                    for plan, series, block, window in zip(
+                        plans, items, blocks, windows
+                    )
+                ]
+            waves = item.renderer.render_mono_rows(
+                values=np.stack(
+                    [
+                        chart_rows[:, series.column]
+                        for chart_rows, series in zip(rows, items)
+                    ]
+                ),
+                source_min=np.array([value_range.min_value for value_range in ranges]),  # type: ignore
+                source_max=np.array([value_range.max_value for value_range in ranges]),  # type: ignore
+                duration=duration,
+                sample_rate=sample_rate,
+                frequency_range=item.frequency_range,
+            )
+            kernels.mix_rows_into(output, waves, item.channel_gains)
+
+        if fallback:
+            for plan, series, sample in zip(plans, selected, output):
+                sample += plan.mix(
+                    bounds, [series[idx] for idx in fallback], position, duration
+                )
+
+        kernels.normalize_rows(output)
+        return output
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import threading
 import warnings
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import timedelta
-from functools import cached_property
 from typing import Any, Hashable, Iterator, Literal, overload
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from audible_plot import kernels
+from audible_plot.diskcache import AudioDiskCache
+from audible_plot.events import EventIndex, EventPredicate
 from audible_plot.generators import AudioBuffer
+from audible_plot.plan import RenderPlan, SeriesPlan
 from audible_plot.player import AudioPlayer
+from audible_plot.pool import ProcessPoolRenderer
 from audible_plot.render import AbstractDataRenderer, SilentRenderer
+from audible_plot.runs import RunLengthColumn
+from audible_plot.sliding import SlidingRenderCache
+from audible_plot.timeline import EventSchedule, TimelineRenderer, index_times
 from audible_plot.utils import AbstractValueRange, DynamicValueRange
 
 
@@ -23,33 +32,47 @@ class AudibleSeries:
         renderer: AbstractDataRenderer,
         value_range: AbstractValueRange | None = None,
         is_extra: bool = False,
+        run_length: bool | None = None,
+        voice: Hashable | None = None,
     ) -> None:
-        self._data = data
+        self._voice = voice
 
         self._value_range = value_range
 
         self._renderer = renderer
-        self._chart = None
         self._is_extra = is_extra or value_range is not None
-
-    @property
-    def chart(self) -> AudibleChart:
-        if self._chart is None:
-            raise RuntimeError("Chart is not set yet.")
-        return self._chart
-
-    @chart.setter
-    def chart(self, value: AudibleChart) -> None:
-        if self._chart is not None:
-            raise TypeError(
-                "The same series object cannot be used in more than one chart."
-            )
-        self._chart = value
+        self._runs = self._encode_runs(data, run_length)
+        # Encoded series keep only their runs, and the empty series for
+        # their name and type
+        self._data = data if self._runs is None else data.iloc[:0]
+        self._index = data.index
+
+    @staticmethod
+    def _encode_runs(
+        data: pd.Series, run_length: bool | None
+    ) -> RunLengthColumn | None:
+        if run_length is False or not pd.api.types.is_numeric_dtype(data):
+            return None
+        runs = RunLengthColumn.encode(data.to_numpy(dtype=np.float64))
+        if run_length or runs.is_step_like:
+            return runs
+        return None
 
     @property
     def key(self):
         return self._data.name
 
+    @property
+    def data(self) -> pd.Series:
+        """The series values, decoded from its runs if it is encoded."""
+        if self._runs is None:
+            return self._data
+        return pd.Series(
+            self._runs.decode().astype(self._data.dtype),
+            index=self._index,
+            name=self._data.name,
+        )
+
     @property
     def value_range(self) -> AbstractValueRange | None:
         return self._value_range
@@ -61,10 +84,10 @@ class AudibleSeries:
     def __getitem__(self, idx: slice) -> pd.Series: ...
 
     def __getitem__(self, idx: slice | int) -> float | pd.Series:
-        return self._data[idx]  # type: ignore
+        return self.data[idx]  # type: ignore
 
     def __len__(self) -> int:
-        return len(self._data)
+        return len(self._index)
 
     def window(self, position: slice) -> AudibleSeriesWindow:
         return AudibleSeriesWindow(self, position)
@@ -73,10 +96,20 @@ class AudibleSeries:
     def renderer(self):
         return self._renderer
 
+    @property
+    def runs(self) -> RunLengthColumn | None:
+        """The series values as runs, if the series is stored run-length encoded."""
+        return self._runs
+
     @property
     def is_extra(self):
         return self._is_extra
 
+    @property
+    def voice(self) -> Hashable | None:
+        """Key of the series this one modulates, if any."""
+        return self._voice
+
     def __str__(self) -> str:
         return str(self.key)
 
@@ -87,9 +120,12 @@ class AudibleSeries:
 class AudibleSeriesWindow:
     def __init__(self, series: AudibleSeries, position: slice) -> None:
         self._series = series
-        self._values = series[position]
         self._position = position
 
+    @property
+    def _values(self) -> pd.Series:
+        return self._series[self._position]
+
     @property
     def value_range(self) -> AbstractValueRange:
         if self._series.value_range is not None:
@@ -126,9 +162,43 @@ class SeriesConfig:
     range: AbstractValueRange | None = None
     key: Hashable
     is_extra: bool = False
+    # Store and render the series as runs of identical values. By default
+    # this is enabled for step-like series only.
+    run_length: bool | None = None
+    # Key of another series whose output is shaped by this series' renderer
+    # envelope (e.g. an `AmplitudeDataRenderer` on volume applied to the
+    # close price pitch) instead of playing on its own.
+    voice: Hashable | None = None
+
+
+# How columns are aggregated when resampling a chart, by lowercase column
+# name. Other columns keep their last value in each period.
+DEFAULT_AGGREGATIONS: Mapping[str, str] = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
+def _is_positional(bounds: slice) -> bool:
+    return all(
+        bound is None or isinstance(bound, (int, np.integer))
+        for bound in (bounds.start, bounds.stop)
+    )
 
 
 class AudibleChart:
+    """Series of a data frame rendered as sound.
+
+    Charts are not modified by rendering, so one chart can serve renders
+    from several threads at once, and renders of a window do not depend on
+    the ones before. Audio is only reused between renders through a
+    sliding cache given to `window`, one per listening session (e.g. per
+    thread) from `sliding_cache`.
+    """
+
     def __init__(
         self,
         *,
@@ -136,7 +206,22 @@ class AudibleChart:
         config: Sequence[SeriesConfig] = [],
         sample_rate: float = 44100,
         frequency_range: AbstractValueRange,
+        aggregations: Mapping[Hashable, str] | None = None,
+        keep_columns: Sequence[Hashable] | Literal["all"] = (),
+        dtype: npt.DTypeLike = np.float64,
+        cache: AudioDiskCache | None = None,
+        player: AudioPlayer | None = None,
     ) -> None:
+        """Build a chart from `data`, one series per configured column.
+
+        Columns without a config are dropped unless listed in
+        `keep_columns` (or it is "all"), in which case they are kept as
+        silent series. Float columns are stored with `dtype`; pass
+        `np.float32` to halve the memory of large charts, while run-length
+        encoded columns (see `SeriesConfig.run_length`) are only stored as
+        their runs. Rendered series audio is kept in `cache`, if given, and
+        reused across sessions.
+        """
         match data:
             case np.ndarray(shape=shape) | pd.DataFrame(shape=shape) if len(shape) != 2:
                 raise TypeError(
@@ -151,8 +236,7 @@ class AudibleChart:
             raise TypeError(
                 "Config list length is greather than the number of data columns."
             )
-        self._data = data
-        self._player = AudioPlayer()
+        self._player = player or AudioPlayer(sample_rate)
         self._config = {}
         for item in config:
             if item.key in self._config:
@@ -161,38 +245,213 @@ class AudibleChart:
                 )
             self._config[item.key] = item
 
+        if keep_columns != "all":
+            keep = {*self._config, *keep_columns}
+            data = data[[key for key in data.columns if key in keep]]
+        self._dtype = np.dtype(dtype)
+        if self._dtype != np.float64:
+            data = data.astype(
+                {
+                    key: self._dtype
+                    for key, column_type in data.dtypes.items()
+                    if pd.api.types.is_float_dtype(column_type)
+                }
+            )
         self._sample_rate = sample_rate
         self._frequency_range = frequency_range
+        self._cache = cache
+        self._aggregations = dict(aggregations or {})
+        # Guards the lazily built resampled charts and event indexes
+        self._lock = threading.Lock()
+        self._resampled: dict[pd.DateOffset, AudibleChart] = {}
+        self._events: dict[tuple[Hashable, EventPredicate | None], EventIndex] = {}
+        self._series = [self._map_series(data[key]) for key in data.keys()]
+        self._plan = self._compile_plan(data)
+        # Run-length encoded columns are only kept as runs
+        encoded = [series.key for series in self._series if series.runs is not None]
+        self._data = data.drop(columns=encoded) if encoded else data
+        self._columns = {series.key: series for series in self._series}
+        self._timeline = TimelineRenderer(self._plan, index_times(self._data.index))
+
+    def _map_series(self, series: pd.Series) -> AudibleSeries:
+        config = self._config.get(series.name)
+        if config is None:
+            config = SeriesConfig(
+                key=series.name,
+                range=None,
+                renderer=SilentRenderer(),
+                # This is to avoid a bad range usage from the chart
+                is_extra=True,
+                run_length=False,
+            )
+
+        return AudibleSeries(
+            data=series,
+            renderer=config.renderer,
+            value_range=config.range,
+            is_extra=config.is_extra,
+            run_length=config.run_length,
+            voice=config.voice,
+        )
+
+    def _compile_plan(self, data: pd.DataFrame) -> RenderPlan:
+        # Run-length encoded series are kept out of the dense value matrix,
+        # as are silent series which are not used for value ranges either
+        dense = [
+            idx
+            for idx, series in enumerate(self._series)
+            if series.runs is None
+            and not (series.renderer.is_silent and series.is_extra)
+        ]
+        columns = {idx: column for column, idx in enumerate(dense)}
+        return RenderPlan(
+            values=data.iloc[:, dense].to_numpy(dtype=self._dtype, copy=True),
+            series=tuple(
+                SeriesPlan(
+                    key=series.key,
+                    column=columns.get(idx),
+                    runs=series.runs,
+                    renderer=series.renderer,
+                    value_range=series.value_range,
+                    frequency_range=series.renderer.frequency_range
+                    or self._frequency_range,
+                    is_extra=series.is_extra,
+                    channel_gains=series.renderer.channel_gains,
+                    voice=series.voice,
+                )
+                for idx, series in enumerate(self._series)
+            ),
+            sample_rate=self._sample_rate,
+            cache=self._cache,
+        )
 
     @property
     def player(self):
         return self._player
 
     @property
-    def series(self) -> list[AudibleSeries]:
-        def _map_series(series: pd.Series):
-            config = self._config.get(series.name)
-            if config is None:
-                config = SeriesConfig(
-                    key=series.name,
-                    range=None,
-                    renderer=SilentRenderer(),
-                    # This is to avoid a bad range usage from the chart
-                    is_extra=True,
-                )
+    def plan(self) -> RenderPlan:
+        return self._plan
 
-            return AudibleSeries(
-                data=series,
-                renderer=config.renderer,
-                value_range=config.range,
-                is_extra=config.is_extra,
-            )
+    @property
+    def series(self) -> list[AudibleSeries]:
+        return list(self._series)
 
-        return [_map_series(self._data[series]) for series in self._data.keys()]
+    @property
+    def index(self) -> pd.Index:
+        return self._data.index
 
-    def window(self, window_bounds: slice | None = None) -> AudibleChartWindow:
+    def window(
+        self,
+        window_bounds: slice | None = None,
+        sliding: SlidingRenderCache | None = None,
+    ) -> AudibleChartWindow:
+        """Return a window of the chart.
+
+        Bounds are positions, or index labels (e.g. timestamps) for charts
+        with a sorted index; label bounds are resolved with `locate`, and
+        their step is kept as a step in rows. Whole window renders reuse
+        audio through `sliding`, if given, and are rendered afresh otherwise.
+        """
         window_bounds = window_bounds or slice(None, None)
-        return AudibleChartWindow(self, window_bounds, self._sample_rate)
+        if not _is_positional(window_bounds):
+            located = self.locate(window_bounds.start, window_bounds.stop)
+            window_bounds = slice(located.start, located.stop, window_bounds.step)
+        return AudibleChartWindow(self, window_bounds, self._sample_rate, sliding)
+
+    def sliding_cache(self) -> SlidingRenderCache:
+        """A new sliding cache over the chart, for one listening session."""
+        return SlidingRenderCache(self._plan)
+
+    def process_pool(
+        self, processes: int | None = None, start_method: str | None = None
+    ) -> ProcessPoolRenderer:
+        """Start worker processes rendering windows of the chart in parallel.
+
+        The chart columns are shared with the workers instead of copied;
+        close the pool (or use it as a context manager) to release them.
+        """
+        return ProcessPoolRenderer(self._plan, processes, start_method)
+
+    def events(
+        self, key: Hashable, predicate: EventPredicate | None = None
+    ) -> EventIndex:
+        """Index the rows of series `key` matching `predicate`.
+
+        The predicate gets the whole column and returns a boolean mask;
+        without it, nonzero values are events (e.g. trade signals).
+        Indexes are built on first use and cached per key and predicate.
+        """
+        with self._lock:
+            index = self._events.get((key, predicate))
+        if index is None:
+            index = EventIndex.from_values(
+                self._columns[key].data.to_numpy(), predicate
+            )
+            with self._lock:
+                index = self._events.setdefault((key, predicate), index)
+        return index
+
+    def next_event(
+        self, key: Hashable, position: int, predicate: EventPredicate | None = None
+    ) -> int | None:
+        """Position of the first event of series `key` after `position`."""
+        return self.events(key, predicate).next(position)
+
+    def previous_event(
+        self, key: Hashable, position: int, predicate: EventPredicate | None = None
+    ) -> int | None:
+        """Position of the last event of series `key` before `position`."""
+        return self.events(key, predicate).previous(position)
+
+    def _frame(self) -> pd.DataFrame:
+        """The chart data, with run-length encoded columns decoded."""
+        if len(self._data.columns) == len(self._series):
+            return self._data
+        return pd.concat([series.data for series in self._series], axis=1)
+
+    def locate(self, start: Any = None, end: Any = None) -> slice:
+        """Positional bounds of the rows labelled from `start` up to, but
+        excluding, `end`, found by binary search over the sorted index."""
+        index = self._data.index
+        if not index.is_monotonic_increasing:
+            raise TypeError("Locating rows by label requires a sorted index.")
+        return slice(
+            None if start is None else int(index.searchsorted(start, side="left")),
+            None if end is None else int(index.searchsorted(end, side="left")),
+        )
+
+    def resample(self, timeframe: str | timedelta | pd.DateOffset) -> AudibleChart:
+        """Return this chart aggregated to a coarser timeframe.
+
+        Columns are aggregated as configured in `aggregations`, falling back
+        to `DEFAULT_AGGREGATIONS`. Resampled charts are built on first use
+        and cached per timeframe.
+        """
+        offset = pd.tseries.frequencies.to_offset(timeframe)
+        with self._lock:
+            chart = self._resampled.get(offset)
+        if chart is None:
+            rules = {
+                key: self._aggregations.get(
+                    key, DEFAULT_AGGREGATIONS.get(str(key).lower(), "last")
+                )
+                for key in self._columns
+            }
+            chart = AudibleChart(
+                data=self._frame().resample(offset).agg(rules).dropna(how="all"),  # type: ignore
+                config=list(self._config.values()),
+                sample_rate=self._sample_rate,
+                frequency_range=self._frequency_range,
+                aggregations=self._aggregations,
+                keep_columns="all",
+                dtype=self._dtype,
+                cache=self._cache,
+                player=self._player,
+            )
+            with self._lock:
+                chart = self._resampled.setdefault(offset, chart)
+        return chart
 
     @property
     def extra(self):
@@ -216,11 +475,19 @@ class AudibleChartWindow(Mapping[Hashable, AudibleSeriesWindow]):
         chart: AudibleChart,
         position: slice,
         sample_rate: float,
+        sliding: SlidingRenderCache | None = None,
     ) -> None:
         self._series = {data.key: data.window(position) for data in chart.series}
         self._player = chart.player
         self._sample_rate = sample_rate
-        self._freq_range = chart.frequency_range
+        self._plan = chart.plan
+        self._sliding = sliding
+        self._timeline = chart._timeline
+        self._position = position
+
+    @property
+    def player(self) -> AudioPlayer:
+        return self._player
 
     @property
     def extra(self) -> Mapping[Hashable, AudibleSeriesWindow]:
@@ -232,7 +499,7 @@ class AudibleChartWindow(Mapping[Hashable, AudibleSeriesWindow]):
     def series(self):
         return list(self._series.values())
 
-    @cached_property
+    @property
     def value_range(self):
         return DynamicValueRange(
             values=[
@@ -257,48 +524,77 @@ class AudibleChartWindow(Mapping[Hashable, AudibleSeriesWindow]):
         position: slice | int | None = None,
         duration: timedelta = timedelta(seconds=0.5),
     ) -> AudioBuffer:
-        if names == "all":
-            names = [w.key for w in self.series]
-        elif not isinstance(names, (tuple, list, set)):
-            names = [names]
-
-        sample: AudioBuffer | None = None
-        for name in names:
-            rendered = self._render_single(duration, name, position)
-            if sample is None:
-                sample = rendered
-            else:
-                sample = sample + rendered  # type: ignore
-
-        if sample is None:
-            return np.ndarray((0, 2), np.float64)
-
-        sample_max = np.max(np.abs(sample))
-        if sample_max > 1:
-            return sample / sample_max
-        return sample
-
-    def _render_single(
-        self, duration: timedelta, name: Hashable, position: int | slice | None = None
-    ) -> AudioBuffer:
-        if position is None:
-            position = slice(None, None)
+        """Render the window, or the rows at `position` within it.
+
+        Whole windows are rendered through the window's sliding cache, if
+        any, so audio shared with the previously rendered window is reused.
+        """
+        if position is None and self._sliding is not None:
+            return self._sliding.render(self._position, names, duration)
         if isinstance(position, int):
             position = slice(position, position + 1)
-        series = self._series[name]
-        if series.is_extra:
-            value_range = series.value_range
-        else:
-            value_range = self.value_range
-
-        return series.renderer.render_values(
-            value_list=list(series[position]),
-            value_range=value_range,
+
+        return self._plan.render(
+            self._position,
+            names=names,
+            position=position,
             duration=duration,
-            sample_rate=self._sample_rate,
-            frequency_range=self._freq_range,
         )
 
+    def render_grains(
+        self,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(milliseconds=80),
+    ) -> np.ndarray:
+        """Render every point of the window as a short grain.
+
+        Returns a (points, samples, 2) array with one short buffer per
+        point, ready to be played as the cursor moves. The window is
+        rendered once, with the value ranges of the whole window as in
+        `render`, and normalized as a whole so that grains keep their
+        relative loudness; each grain is the stretch of that render at its
+        point.
+        """
+        points = len(range(len(self._plan))[self._position])
+        sample_size = int(duration.total_seconds() * self._sample_rate)
+        sample = self._plan.mix(
+            self._position, self._plan.select(names), duration=duration
+        )
+        if not len(sample):
+            return np.zeros((points, sample_size, 2))
+        kernels.normalize(sample)
+        return sample.reshape(points, sample_size, 2)
+
+    def schedule(
+        self,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(seconds=0.5),
+        period: timedelta | float | None = None,
+        max_duration: timedelta | None = None,
+    ) -> EventSchedule:
+        """Lay out the window as events placed at the times of its rows.
+
+        `period` of data (a time span for datetime indexes, a step in index
+        units for numeric ones) lasts `duration`; by default it is the
+        median step between rows. See `TimelineRenderer`.
+        """
+        if isinstance(period, timedelta):
+            period = period.total_seconds()
+        return self._timeline.schedule(
+            self._position, names, duration, period, max_duration
+        )
+
+    def render_timeline(
+        self,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(seconds=0.5),
+        period: timedelta | float | None = None,
+        max_duration: timedelta | None = None,
+    ) -> AudioBuffer:
+        """Render the window with durations proportional to the time
+        between rows, so irregular and sparse data keep their rhythm."""
+        return self.schedule(names, duration, period, max_duration).render()
+
     def play(
         self,
         names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import zipfile
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on `path`, shared by every process."""
+    with open(path, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+        else:
+            import fcntl
+
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class AudioDiskCache:
+    """Rendered audio stored on disk, addressed by the hash of its inputs.
+
+    Entries are float32 arrays saved as raw `.npy` files and memory-mapped
+    when read, or zlib-compressed `.npz` files when `compress` is set.
+    Files are written to a temporary name and renamed into place, so
+    readers in other processes never see partial entries; writers take a
+    lock file while adding entries and updating their total size, kept in
+    a counter file. Only when it goes over `max_bytes` is the directory
+    scanned to evict the least recently used entries.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int = 1 << 30,
+        compress: bool = False,
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._compress = compress
+        self._suffix = ".npz" if compress else ".npy"
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @staticmethod
+    def key(*parts: object) -> str:
+        """Hash the parts of a key; arrays are hashed by dtype, shape and data."""
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, np.ndarray):
+                digest.update(f"{part.dtype.str}{part.shape}".encode())
+                digest.update(np.ascontiguousarray(part).data)
+            else:
+                digest.update(repr(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / (key + self._suffix)
+
+    def get(self, key: str) -> np.ndarray | None:
+        path = self._path(key)
+        try:
+            if self._compress:
+                with np.load(path) as entry:
+                    audio = entry["audio"]
+            else:
+                audio = np.load(path, mmap_mode="r")
+            # The modification time tracks use, for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (
+            OSError,
+            ValueError,
+            EOFError,
+            KeyError,
+            zipfile.BadZipFile,
+            zlib.error,
+        ):
+            # Damaged entries are removed so that they are written again
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return audio
+
+    def put(self, key: str, audio: np.ndarray) -> None:
+        path = self._path(key)
+        if path.exists():
+            return
+        path.parent.mkdir(exist_ok=True)
+        audio = np.asarray(audio, dtype=np.float32)
+        handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+        with os.fdopen(handle, "wb") as file:
+            if self._compress:
+                np.savez_compressed(file, audio=audio)
+            else:
+                np.save(file, audio)
+        size = os.stat(temporary).st_size
+        with _locked(self._directory / ".lock"):
+            if path.exists():
+                # Another process added the entry meanwhile
+                os.unlink(temporary)
+                return
+            try:
+                os.replace(temporary, path)
+            except OSError:
+                os.unlink(temporary)
+                return
+            total = self._read_total()
+            if total is None or total + size > self._max_bytes:
+                self._evict()
+            else:
+                self._write_total(total + size)
+
+    def _read_total(self) -> int | None:
+        try:
+            return int((self._directory / ".size").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_total(self, total: int) -> None:
+        (self._directory / ".size").write_text(str(total))
+
+    def _entries(self) -> list[tuple[os.stat_result, Path]]:
+        entries = []
+        for path in self._directory.glob(f"*/*{self._suffix}"):
+            try:
+                entries.append((path.stat(), path))
+            except OSError:
+                # Removed by another process meanwhile
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries over `max_bytes`, and
+        recount the total size from the entries left."""
+        entries = self._entries()
+        total = sum(stat.st_size for stat, _ in entries)
+        entries.sort(key=lambda entry: entry[0].st_mtime)
+        for stat, path in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                # Still mapped by a reader on platforms that forbid it
+                continue
+            total -= stat.st_size
+        self._write_total(total)
+
+    def clear(self) -> None:
+        with _locked(self._directory / ".lock"):
+            for _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """Bytes used by the cache entries."""
+        return sum(stat.st_size for stat, _ in self._entries())
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+# Vectorized predicate, returning a boolean mask for an array of values
+EventPredicate = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass(frozen=True, eq=False)
+class EventIndex:
+    """Sorted positions of the rows of a series where an event happens,
+    such as a trade signal or an indicator extreme."""
+
+    positions: np.ndarray
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> EventIndex:
+        return cls(np.flatnonzero(np.asarray(mask, dtype=bool)))
+
+    @classmethod
+    def from_values(
+        cls, values: np.ndarray, predicate: EventPredicate | None = None
+    ) -> EventIndex:
+        """Index the values matching `predicate`, or the nonzero ones."""
+        values = np.asarray(values)
+        if predicate is None:
+            return cls.from_mask((values != 0) & ~np.isnan(values))
+        return cls.from_mask(predicate(values))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def next(self, position: int) -> int | None:
+        """The first event after `position`, if any."""
+        idx = np.searchsorted(self.positions, position, side="right")
+        if idx == len(self.positions):
+            return None
+        return int(self.positions[idx])
+
+    def previous(self, position: int) -> int | None:
+        """The last event before `position`, if any."""
+        idx = np.searchsorted(self.positions, position, side="left")
+        if idx == 0:
+            return None
+        return int(self.positions[idx - 1])
+
+    def between(self, start: int, stop: int) -> np.ndarray:
+        """The events from `start` up to, but excluding, `stop`."""
+        return self.positions[
+            np.searchsorted(self.positions, start) : np.searchsorted(
+                self.positions, stop
+            )
+        ]
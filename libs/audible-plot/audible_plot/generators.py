@@ -4,6 +4,8 @@ from typing import Literal, Sequence, TypeAlias
 
 import numpy as np
 
+from audible_plot import kernels
+
 AudioBuffer: TypeAlias = np.ndarray[tuple[int, Literal[2]], np.dtypes.Float64DType]
 
 
@@ -17,42 +19,92 @@ class ToneGenerator:
     def __init__(self, wave_type: WaveType = WaveType.sine) -> None:
         self._wave_type = wave_type
 
-    def generate_sliding(
+    @property
+    def wave_type(self) -> WaveType:
+        return self._wave_type
+
+    def synthesize(
         self,
         sample_rate: float,
         duration: timedelta,
-        freq_points: Sequence[float],
-    ) -> AudioBuffer:
-        freq_points = list(freq_points)
+        freq_points: Sequence[float] | np.ndarray,
+        sliding: bool = False,
+        counts: np.ndarray | None = None,
+        phase: float = 0.0,
+    ) -> np.ndarray:
+        """Synthesize a mono wave with one `duration` segment per point.
 
-        if len(freq_points) == 1:
-            freq_points.append(freq_points[0])
-        sample_duration = duration.total_seconds()
-        sample_size = int(sample_duration * sample_rate)
-        raw_duration = sample_duration * (len(freq_points) - 1)
-        wave_size = int(raw_duration * sample_rate)
-        freq = np.zeros((wave_size,))
-        wave = np.zeros((wave_size,))
-        for freq_idx, freq_value in enumerate(freq_points):
-            if freq_idx == 0:
-                continue
-            freq_start = freq_points[freq_idx - 1]
-            freq_end = freq_value
-            pos_start = int((freq_idx - 1) * sample_rate * sample_duration)
-            pos_end = int(freq_idx * sample_rate * sample_duration)
-            freq[pos_start:pos_end] = np.linspace(freq_start, freq_end, sample_size)
+        Sliding waves glide between consecutive points, so they have one
+        segment less than the number of points. `counts` repeats each
+        (target) point for that many segments, keeping the phase continuous.
+        The wave starts at `phase` radians.
+        """
+        points, counts = self._segments(freq_points, sliding, counts)
+        return kernels.synthesize(
+            points,
+            counts,
+            int(duration.total_seconds() * sample_rate),
+            float(sample_rate),
+            int(self._wave_type),
+            sliding,
+            float(phase),
+        )
 
-        phase = 2 * np.pi * np.cumsum(freq) / sample_rate
-        if self._wave_type in (self.WaveType.sine, self.WaveType.square):
-            wave = np.sin(phase)
-        elif self._wave_type in (self.WaveType.sawtooth, self.WaveType.triangle):
-            wave = 2 * (phase / (2 * np.pi) - np.floor(phase / (2 * np.pi) + 0.5))
+    def phase_advances(
+        self,
+        sample_rate: float,
+        duration: timedelta,
+        freq_points: Sequence[float] | np.ndarray,
+        sliding: bool = False,
+        counts: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """The phase, in radians, that `synthesize` advances over each segment
+        (or run of `counts` segments)."""
+        points, counts = self._segments(freq_points, sliding, counts)
+        return kernels.phase_advances(
+            points,
+            counts,
+            int(duration.total_seconds() * sample_rate),
+            float(sample_rate),
+            sliding,
+        )
+
+    @staticmethod
+    def _segments(
+        freq_points: Sequence[float] | np.ndarray,
+        sliding: bool,
+        counts: np.ndarray | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        points = np.asarray(freq_points, dtype=np.float64)
+        if sliding and len(points) == 1:
+            points = np.concatenate((points, points))
+        if counts is None:
+            counts = np.ones(len(points) - 1 if sliding else len(points), np.int64)
+        return points, np.asarray(counts, dtype=np.int64)
 
-        if self._wave_type == self.WaveType.square:
-            wave = np.sign(wave)
-        elif self._wave_type == self.WaveType.triangle:
-            wave = 2 * np.abs(wave) - 1
+    def synthesize_rows(
+        self,
+        sample_rate: float,
+        duration: timedelta,
+        freq_points: np.ndarray,
+        sliding: bool = False,
+    ) -> np.ndarray:
+        """Synthesize one mono wave per row of a two-dimensional point array."""
+        return kernels.synthesize_rows(
+            np.asarray(freq_points, dtype=np.float64),
+            int(duration.total_seconds() * sample_rate),
+            float(sample_rate),
+            int(self._wave_type),
+            sliding,
+        )
 
+    def generate_sliding(
+        self,
+        sample_rate: float,
+        duration: timedelta,
+        freq_points: Sequence[float],
+    ) -> AudioBuffer:
+        wave = self.synthesize(sample_rate, duration, freq_points, sliding=True)
         return np.column_stack((wave, wave))  # type: ignore
 
     def generate_fixed(
@@ -61,28 +113,5 @@ class ToneGenerator:
         duration: timedelta,
         freq_points: Sequence[float],
     ) -> AudioBuffer:
-        freq_points = list(freq_points)
-
-        sample_duration = duration.total_seconds()
-        sample_size = int(sample_duration * sample_rate)
-        raw_duration = sample_duration * (len(freq_points))
-        wave_size = int(raw_duration * sample_rate)
-        freq = np.zeros((wave_size,))
-        wave = np.zeros((wave_size,))
-        for freq_idx, freq_value in enumerate(freq_points):
-            pos_start = int(freq_idx * sample_size)
-            pos_end = int((freq_idx + 1) * sample_rate * sample_duration)
-            freq[pos_start:pos_end] = freq_value
-
-        phase = 2 * np.pi * np.cumsum(freq) / sample_rate
-        if self._wave_type in (self.WaveType.sine, self.WaveType.square):
-            wave = np.sin(phase)
-        elif self._wave_type in (self.WaveType.sawtooth, self.WaveType.triangle):
-            wave = 2 * (phase / (2 * np.pi) - np.floor(phase / (2 * np.pi) + 0.5))
-
-        if self._wave_type == self.WaveType.square:
-            wave = np.sign(wave)
-        elif self._wave_type == self.WaveType.triangle:
-            wave = 2 * np.abs(wave) - 1
-
+        wave = self.synthesize(sample_rate, duration, freq_points)
         return np.column_stack((wave, wave))  # type: ignore
@@ -0,0 +1,211 @@
+"""Technical indicators updated one row at a time.
+
+Each indicator keeps only the state it needs to compute its next value, so
+updating it costs the same regardless of how many rows came before. Output
+keys follow the pandas-ta column names.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Hashable, Mapping
+from typing import Literal
+
+
+class StreamingIndicator(ABC):
+    @property
+    @abstractmethod
+    def keys(self) -> tuple[Hashable, ...]:
+        """The keys of the values returned by `update`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, row: Mapping[Hashable, float]) -> tuple[float, ...]:
+        """Consume a new row and return the indicator values for it."""
+        raise NotImplementedError
+
+
+class _EMA:
+    """Exponential moving average seeded with the simple average of the
+    first `period` values; NaN until then."""
+
+    def __init__(self, period: int, alpha: float | None = None) -> None:
+        self._period = period
+        self._alpha = 2 / (period + 1) if alpha is None else alpha
+        self._count = 0
+        self._total = 0.0
+        self._value = math.nan
+
+    def update(self, value: float) -> float:
+        if math.isnan(value):
+            return self._value
+        if self._count < self._period:
+            self._count += 1
+            self._total += value
+            if self._count == self._period:
+                self._value = self._total / self._period
+            return self._value
+        self._value += self._alpha * (value - self._value)
+        return self._value
+
+
+class EMAIndicator(StreamingIndicator):
+    def __init__(self, source: Hashable = "close", period: int = 10) -> None:
+        self._source = source
+        self._period = period
+        self._ema = _EMA(period)
+
+    @property
+    def keys(self) -> tuple[Hashable, ...]:
+        return (f"EMA_{self._period}",)
+
+    def update(self, row: Mapping[Hashable, float]) -> tuple[float, ...]:
+        return (self._ema.update(row[self._source]),)
+
+
+class MACDIndicator(StreamingIndicator):
+    def __init__(
+        self,
+        source: Hashable = "close",
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+    ) -> None:
+        self._source = source
+        self._suffix = f"{fast}_{slow}_{signal}"
+        self._fast = _EMA(fast)
+        self._slow = _EMA(slow)
+        self._signal = _EMA(signal)
+
+    @property
+    def keys(self) -> tuple[Hashable, ...]:
+        return (
+            f"MACD_{self._suffix}",
+            f"MACDh_{self._suffix}",
+            f"MACDs_{self._suffix}",
+        )
+
+    def update(self, row: Mapping[Hashable, float]) -> tuple[float, ...]:
+        value = row[self._source]
+        macd = self._fast.update(value) - self._slow.update(value)
+        signal = self._signal.update(macd)
+        return (macd, macd - signal, signal)
+
+
+class RSIIndicator(StreamingIndicator):
+    """Relative strength index with Wilder's smoothing."""
+
+    def __init__(self, source: Hashable = "close", period: int = 14) -> None:
+        self._source = source
+        self._period = period
+        self._gain = _EMA(period, alpha=1 / period)
+        self._loss = _EMA(period, alpha=1 / period)
+        self._previous = math.nan
+
+    @property
+    def keys(self) -> tuple[Hashable, ...]:
+        return (f"RSI_{self._period}",)
+
+    def update(self, row: Mapping[Hashable, float]) -> tuple[float, ...]:
+        value = row[self._source]
+        change = value - self._previous
+        self._previous = value
+        if math.isnan(change):
+            return (math.nan,)
+        gain = self._gain.update(max(change, 0.0))
+        loss = self._loss.update(max(-change, 0.0))
+        if math.isnan(gain):
+            return (math.nan,)
+        if gain + loss == 0:
+            return (50.0,)
+        return (100 * gain / (gain + loss),)
+
+
+class AroonIndicator(StreamingIndicator):
+    """Aroon down, up and oscillator.
+
+    The highest high and lowest low of the last `period + 1` rows are
+    tracked with monotonic queues, which makes each update O(1) amortized.
+    """
+
+    def __init__(
+        self, high: Hashable = "high", low: Hashable = "low", period: int = 14
+    ) -> None:
+        self._high = high
+        self._low = low
+        self._period = period
+        self._position = -1
+        # (position, value) pairs, values decreasing for highs and
+        # increasing for lows, so the front holds the window extreme.
+        self._highs: deque[tuple[int, float]] = deque()
+        self._lows: deque[tuple[int, float]] = deque()
+
+    @property
+    def keys(self) -> tuple[Hashable, ...]:
+        return (
+            f"AROOND_{self._period}",
+            f"AROONU_{self._period}",
+            f"AROONOSC_{self._period}",
+        )
+
+    def update(self, row: Mapping[Hashable, float]) -> tuple[float, ...]:
+        self._position += 1
+        position = self._position
+        high = row[self._high]
+        low = row[self._low]
+        # Ties resolve to the most recent extreme, as in pandas-ta
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((position, high))
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((position, low))
+        oldest = position - self._period
+        while self._highs[0][0] < oldest:
+            self._highs.popleft()
+        while self._lows[0][0] < oldest:
+            self._lows.popleft()
+
+        if oldest < 0:
+            return (math.nan, math.nan, math.nan)
+        up = 100 * (1 - (position - self._highs[0][0]) / self._period)
+        down = 100 * (1 - (position - self._lows[0][0]) / self._period)
+        return (down, up, up - down)
+
+
+class CrossoverIndicator(StreamingIndicator):
+    """Trade signals from one value crossing another.
+
+    The value is 1 on the row where `first` moves above (or below)
+    `second`, -1 on the row where that stops being true and 0 otherwise,
+    like the `TS_Trades` column of pandas-ta `tsignals`.
+    """
+
+    def __init__(
+        self,
+        first: Hashable,
+        second: Hashable,
+        *,
+        key: Hashable,
+        direction: Literal["above", "below"] = "above",
+    ) -> None:
+        self._first = first
+        self._second = second
+        self._key = key
+        self._direction = direction
+        self._trend = 0
+
+    @property
+    def keys(self) -> tuple[Hashable, ...]:
+        return (self._key,)
+
+    def update(self, row: Mapping[Hashable, float]) -> tuple[float, ...]:
+        if self._direction == "above":
+            trend = int(row[self._first] > row[self._second])
+        else:
+            trend = int(row[self._first] < row[self._second])
+        signal = trend - self._trend
+        self._trend = trend
+        return (float(signal),)
@@ -0,0 +1,437 @@
+"""Numeric kernels used by the render pipeline.
+
+Every kernel has a NumPy implementation, which is the reference behaviour.
+When numba is installed the kernels are replaced by single-pass compiled
+versions that avoid the intermediate arrays of the NumPy chains; they are
+cached on disk so the JIT cost is only paid once. Set the
+``AUDIBLE_PLOT_DISABLE_NUMBA`` environment variable to force the NumPy path.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAS_NUMBA = numba is not None and not os.environ.get("AUDIBLE_PLOT_DISABLE_NUMBA")
+
+# Wave shapes, matching `ToneGenerator.WaveType` values.
+SINE = 1
+SQUARE = 2
+TRIANGLE = 3
+SAWTOOTH = 4
+
+
+def shape_wave(phase: np.ndarray, wave_type: int) -> np.ndarray:
+    if wave_type in (SINE, SQUARE):
+        wave = np.sin(phase)
+    else:
+        wave = 2 * (phase / (2 * np.pi) - np.floor(phase / (2 * np.pi) + 0.5))
+
+    if wave_type == SQUARE:
+        wave = np.sign(wave)
+    elif wave_type == TRIANGLE:
+        wave = 2 * np.abs(wave) - 1
+    return wave
+
+
+def numpy_synthesize(
+    points: np.ndarray,
+    counts: np.ndarray,
+    sample_size: int,
+    sample_rate: float,
+    wave_type: int,
+    sliding: bool,
+    phase: float = 0.0,
+) -> np.ndarray:
+    """Synthesize `counts[i]` segments of `sample_size` samples per point.
+
+    Sliding waves take one more point than counts: the first segment of
+    each point glides from the previous one, and the rest hold it. The
+    wave starts at `phase` radians.
+    """
+    targets = points[1:] if sliding else points
+    freq = np.repeat(targets, counts * sample_size)
+    if sliding and len(targets):
+        ramp = np.linspace(0, 1, sample_size)
+        starts = points[:-1, np.newaxis]
+        offsets = np.concatenate(([0], np.cumsum(counts[:-1]))) * sample_size
+        freq[offsets[:, np.newaxis] + np.arange(sample_size)] = (
+            starts + (targets[:, np.newaxis] - starts) * ramp
+        )
+    return shape_wave(phase + 2 * np.pi * np.cumsum(freq) / sample_rate, wave_type)
+
+
+def phase_advances(
+    points: np.ndarray,
+    counts: np.ndarray,
+    sample_size: int,
+    sample_rate: float,
+    sliding: bool,
+) -> np.ndarray:
+    """The phase, in radians, that `synthesize` advances over each point."""
+    targets = points[1:] if sliding else points
+    held = targets * counts * sample_size
+    if sliding and len(targets):
+        # The glide segment averages both ends (a one-sample glide only
+        # holds the start)
+        glide = points[:-1] if sample_size == 1 else (points[:-1] + targets) / 2
+        held += (glide - targets) * sample_size
+    return 2 * np.pi * held / sample_rate
+
+
+def hold_envelope(
+    levels: np.ndarray, counts: np.ndarray, sample_size: int, ramp: int
+) -> np.ndarray:
+    """Hold each level for `counts[i]` segments of `sample_size` samples,
+    moving linearly from the previous level over the first `ramp` samples."""
+    envelope = np.repeat(levels, counts * sample_size)
+    ramp = min(ramp, sample_size)
+    if ramp > 1 and len(levels) > 1:
+        starts = np.cumsum(counts[:-1]) * sample_size
+        steps = np.linspace(0, 1, ramp)
+        envelope[starts[:, np.newaxis] + np.arange(ramp)] = (
+            levels[:-1, np.newaxis] + (levels[1:] - levels[:-1])[:, np.newaxis] * steps
+        )
+    return envelope
+
+
+def pulse_gate(
+    rates: np.ndarray,
+    counts: np.ndarray,
+    sample_size: int,
+    sample_rate: float,
+    duty: float,
+    edge: int,
+) -> np.ndarray:
+    """Gate of pulses at `rates[i]` per second, on for `duty` of each period.
+
+    The pulse phase accumulates across segments, so rate changes do not cut
+    pulses short; pulse edges ramp over `edge` samples.
+    """
+    rate = np.repeat(rates, counts * sample_size)
+    cycles = np.cumsum(rate) / sample_rate
+    # Samples since the pulse started, and until it ends
+    elapsed = (cycles - np.floor(cycles)) * sample_rate / np.maximum(rate, 1e-9)
+    remaining = duty * sample_rate / np.maximum(rate, 1e-9) - elapsed
+    return np.clip(np.minimum(elapsed, remaining) / max(edge, 1), 0, 1)
+
+
+def pan_envelope(pans: np.ndarray) -> np.ndarray:
+    """Per-sample left and right gains for pan positions between -1 and 1.
+
+    Gains follow the constant power law, scaled to 1 at the center.
+    """
+    angle = (1 + pans) * np.pi / 4
+    return np.sqrt(2) * np.column_stack((np.cos(angle), np.sin(angle)))
+
+
+def numpy_map_linear(
+    values: np.ndarray,
+    source_min: float,
+    source_max: float,
+    target_min: float,
+    target_max: float,
+    limit: float,
+) -> np.ndarray:
+    """Linearly map values; a negative limit disables clamping."""
+    target_delta = target_max - target_min
+    mapped = (values - source_min) / (source_max - source_min) * target_delta
+    mapped += target_min
+    if limit >= 0:
+        mapped = np.where(
+            mapped > target_max,
+            np.minimum(mapped, target_max + target_delta * limit),
+            np.where(
+                values < target_min,
+                np.maximum(mapped, target_min - target_delta * limit),
+                mapped,
+            ),
+        )
+    return mapped
+
+
+def numpy_synthesize_rows(
+    points: np.ndarray,
+    sample_size: int,
+    sample_rate: float,
+    wave_type: int,
+    sliding: bool,
+) -> np.ndarray:
+    """Synthesize one wave per row of `points`, one segment per point."""
+    targets = points[:, 1:] if sliding else points
+    if sliding:
+        ramp = np.linspace(0, 1, sample_size)
+        starts = points[:, :-1, np.newaxis]
+        freq = (starts + (targets[:, :, np.newaxis] - starts) * ramp).reshape(
+            len(points), -1
+        )
+    else:
+        freq = np.repeat(targets, sample_size, axis=1)
+    return shape_wave(2 * np.pi * np.cumsum(freq, axis=1) / sample_rate, wave_type)
+
+
+def numpy_map_linear_rows(
+    values: np.ndarray,
+    source_min: np.ndarray,
+    source_max: np.ndarray,
+    target_min: float,
+    target_max: float,
+    limit: float,
+) -> np.ndarray:
+    """Like `map_linear`, with one source range per row of `values`."""
+    return numpy_map_linear(
+        values,
+        source_min[:, np.newaxis],  # type: ignore
+        source_max[:, np.newaxis],  # type: ignore
+        target_min,
+        target_max,
+        limit,
+    )
+
+
+def numpy_mix_into(out: np.ndarray, wave: np.ndarray, gains: np.ndarray) -> None:
+    out += np.outer(wave, gains)
+
+
+def numpy_mix_rows_into(out: np.ndarray, waves: np.ndarray, gains: np.ndarray) -> None:
+    out[:, :, 0] += waves * gains[0]
+    out[:, :, 1] += waves * gains[1]
+
+
+def numpy_normalize(out: np.ndarray) -> None:
+    sample_max = np.max(np.abs(out)) if len(out) else 0
+    if sample_max > 1:
+        out /= sample_max
+
+
+def numpy_normalize_rows(out: np.ndarray) -> None:
+    """Normalize each buffer of a (buffers, samples, channels) array."""
+    if not out.shape[1]:
+        return
+    peaks = np.maximum(out.max(axis=(1, 2)), -out.min(axis=(1, 2)))
+    out /= np.maximum(peaks, 1)[:, np.newaxis, np.newaxis]
+
+
+def numpy_render_events(
+    out: np.ndarray,
+    onsets: np.ndarray,
+    lengths: np.ndarray,
+    frequencies: np.ndarray,
+    phases: np.ndarray,
+    gains: np.ndarray,
+    wave_types: np.ndarray,
+    sample_rate: float,
+) -> None:
+    """Add flat tones to the spans `out[onsets[i]:onsets[i] + lengths[i]]`.
+
+    Each tone starts at `phases[i]` radians and advances like a held
+    `synthesize` segment; samples outside the spans are not touched, and
+    overlapping tones add up.
+    """
+    if not len(onsets):
+        return
+    event = np.repeat(np.arange(len(onsets)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    elapsed = np.arange(len(event)) - starts[event] + 1
+    phase = phases[event] + 2 * np.pi * frequencies[event] * elapsed / sample_rate
+    wave = np.empty(len(event))
+    shapes = wave_types[event]
+    for wave_type in np.unique(wave_types):
+        selected = shapes == wave_type
+        wave[selected] = shape_wave(phase[selected], int(wave_type))
+    np.add.at(out, onsets[event] + elapsed - 1, wave[:, np.newaxis] * gains[event])
+
+
+synthesize = numpy_synthesize
+synthesize_rows = numpy_synthesize_rows
+map_linear = numpy_map_linear
+map_linear_rows = numpy_map_linear_rows
+mix_into = numpy_mix_into
+mix_rows_into = numpy_mix_rows_into
+normalize = numpy_normalize
+normalize_rows = numpy_normalize_rows
+render_events = numpy_render_events
+
+
+if HAS_NUMBA:
+    _jit = numba.njit(cache=True, error_model="numpy")  # type: ignore
+
+    @_jit
+    def _shape_sample(phase: float, wave_type: int) -> float:
+        if wave_type == SINE or wave_type == SQUARE:
+            value = np.sin(phase)
+        else:
+            cycles = phase / (2 * np.pi)
+            value = 2 * (cycles - np.floor(cycles + 0.5))
+
+        if wave_type == SQUARE:
+            value = np.sign(value)
+        elif wave_type == TRIANGLE:
+            value = 2 * abs(value) - 1
+        return value
+
+    @_jit
+    def numba_synthesize(
+        points: np.ndarray,
+        counts: np.ndarray,
+        sample_size: int,
+        sample_rate: float,
+        wave_type: int,
+        sliding: bool,
+        phase: float = 0.0,
+    ) -> np.ndarray:
+        out = np.empty(counts.sum() * sample_size)
+        scale = 2 * np.pi / sample_rate
+        step = 1.0 / (sample_size - 1) if sample_size > 1 else 0.0
+        offset = 1 if sliding else 0
+        total = 0.0
+        pos = 0
+        for point in range(len(counts)):
+            target = points[point + offset]
+            hold = counts[point] * sample_size
+            start = 0
+            if sliding:
+                glide_from = points[point]
+                delta = target - glide_from
+                for idx in range(min(sample_size, hold)):
+                    total += glide_from + delta * (idx * step)
+                    out[pos] = _shape_sample(phase + total * scale, wave_type)
+                    pos += 1
+                start = sample_size
+            for _ in range(start, hold):
+                total += target
+                out[pos] = _shape_sample(phase + total * scale, wave_type)
+                pos += 1
+        return out
+
+    @_jit
+    def numba_map_linear(
+        values: np.ndarray,
+        source_min: float,
+        source_max: float,
+        target_min: float,
+        target_max: float,
+        limit: float,
+    ) -> np.ndarray:
+        target_delta = target_max - target_min
+        source_delta = source_max - source_min
+        upper = target_max + target_delta * limit
+        lower = target_min - target_delta * limit
+        out = np.empty(len(values))
+        for idx in range(len(values)):
+            value = values[idx]
+            mapped = (value - source_min) / source_delta * target_delta + target_min
+            if limit >= 0:
+                if mapped > target_max:
+                    mapped = min(mapped, upper)
+                elif value < target_min:
+                    mapped = max(mapped, lower)
+            out[idx] = mapped
+        return out
+
+    @_jit
+    def numba_synthesize_rows(
+        points: np.ndarray,
+        sample_size: int,
+        sample_rate: float,
+        wave_type: int,
+        sliding: bool,
+    ) -> np.ndarray:
+        segments = points.shape[1] - 1 if sliding else points.shape[1]
+        counts = np.ones(segments, np.int64)
+        out = np.empty((points.shape[0], segments * sample_size))
+        for row in range(points.shape[0]):
+            out[row] = numba_synthesize(
+                points[row], counts, sample_size, sample_rate, wave_type, sliding, 0.0
+            )
+        return out
+
+    @_jit
+    def numba_map_linear_rows(
+        values: np.ndarray,
+        source_min: np.ndarray,
+        source_max: np.ndarray,
+        target_min: float,
+        target_max: float,
+        limit: float,
+    ) -> np.ndarray:
+        out = np.empty(values.shape)
+        for row in range(values.shape[0]):
+            out[row] = numba_map_linear(
+                values[row],
+                source_min[row],
+                source_max[row],
+                target_min,
+                target_max,
+                limit,
+            )
+        return out
+
+    @_jit
+    def numba_mix_into(out: np.ndarray, wave: np.ndarray, gains: np.ndarray) -> None:
+        left = gains[0]
+        right = gains[1]
+        for idx in range(len(wave)):
+            out[idx, 0] += wave[idx] * left
+            out[idx, 1] += wave[idx] * right
+
+    @_jit
+    def numba_normalize(out: np.ndarray) -> None:
+        sample_max = 0.0
+        for idx in range(out.shape[0]):
+            for channel in range(out.shape[1]):
+                sample_max = max(sample_max, abs(out[idx, channel]))
+        if sample_max > 1:
+            out /= sample_max
+
+    @_jit
+    def numba_mix_rows_into(
+        out: np.ndarray, waves: np.ndarray, gains: np.ndarray
+    ) -> None:
+        for row in range(waves.shape[0]):
+            numba_mix_into(out[row], waves[row], gains)
+
+    @_jit
+    def numba_normalize_rows(out: np.ndarray) -> None:
+        for row in range(out.shape[0]):
+            numba_normalize(out[row])
+
+    @_jit
+    def numba_render_events(
+        out: np.ndarray,
+        onsets: np.ndarray,
+        lengths: np.ndarray,
+        frequencies: np.ndarray,
+        phases: np.ndarray,
+        gains: np.ndarray,
+        wave_types: np.ndarray,
+        sample_rate: float,
+    ) -> None:
+        scale = 2 * np.pi / sample_rate
+        for event in range(len(onsets)):
+            onset = onsets[event]
+            left = gains[event, 0]
+            right = gains[event, 1]
+            for idx in range(lengths[event]):
+                value = _shape_sample(
+                    phases[event] + frequencies[event] * (idx + 1) * scale,
+                    wave_types[event],
+                )
+                out[onset + idx, 0] += value * left
+                out[onset + idx, 1] += value * right
+
+    synthesize = numba_synthesize
+    synthesize_rows = numba_synthesize_rows
+    map_linear = numba_map_linear
+    map_linear_rows = numba_map_linear_rows
+    mix_into = numba_mix_into
+    mix_rows_into = numba_mix_rows_into
+    normalize = numba_normalize
+    normalize_rows = numba_normalize_rows
+    render_events = numba_render_events
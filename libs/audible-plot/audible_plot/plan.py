@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Literal
+
+import numpy as np
+
+from audible_plot import kernels
+from audible_plot.diskcache import AudioDiskCache
+from audible_plot.generators import AudioBuffer
+from audible_plot.render import AbstractDataRenderer
+from audible_plot.runs import RunLengthColumn
+from audible_plot.utils import AbstractValueRange, FixedRange
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class SeriesPlan:
+    key: Hashable
+    # Column in the plan values, or None for run-length encoded series and
+    # silent series that take no part in value ranges
+    column: int | None
+    runs: RunLengthColumn | None = None
+    renderer: AbstractDataRenderer
+    value_range: AbstractValueRange | None
+    frequency_range: AbstractValueRange
+    is_extra: bool
+    channel_gains: np.ndarray | None
+    # Key of the series whose output this one modulates with its envelope
+    voice: Hashable | None = None
+
+
+def _run_values(
+    runs: RunLengthColumn, rows: range
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """The runs of a column clipped to contiguous rows, or for stepped rows
+    the value of each row, without run lengths."""
+    if rows.step != 1:
+        return runs.take(np.arange(rows.start, rows.stop, rows.step)), None
+    return runs.runs(slice(rows.start, rows.stop))
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class RenderPlan:
+    """Chart configuration resolved once, so renders only run array operations.
+
+    `values` holds one column per densely stored series, while run-length
+    encoded series keep their runs and are rendered one run at a time
+    (one row at a time in stepped windows).
+    Series whose renderer exposes channel gains are synthesized as mono
+    waves and mixed straight into the output buffer; the rest are rendered
+    in stereo and added to it. Silent series are skipped, and series with
+    a voice are only rendered as envelopes multiplying their voice output.
+
+    With a `cache`, series audio is looked up on disk by the hash of the
+    rendered values and parameters before being synthesized.
+    """
+
+    values: np.ndarray
+    series: tuple[SeriesPlan, ...]
+    sample_rate: float
+    cache: AudioDiskCache | None = None
+    _index: dict[Hashable, int] = field(init=False, repr=False)
+    _related_columns: np.ndarray = field(init=False, repr=False)
+    _related_runs: tuple[RunLengthColumn, ...] = field(init=False, repr=False)
+    _modulators: dict[Hashable, tuple[SeriesPlan, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.values.flags.writeable = False
+        related = [item for item in self.series if not item.is_extra]
+        index = {item.key: idx for idx, item in enumerate(self.series)}
+        modulators: dict[Hashable, tuple[SeriesPlan, ...]] = {}
+        for item in self.series:
+            if item.voice is None:
+                continue
+            if item.voice not in index or self.series[index[item.voice]].voice:
+                raise TypeError(
+                    f"Series {item.key!r} modulates {item.voice!r}, which is not "
+                    "a series with its own voice."
+                )
+            modulators[item.voice] = (*modulators.get(item.voice, ()), item)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_modulators", modulators)
+        object.__setattr__(
+            self,
+            "_related_columns",
+            np.array([item.column for item in related if item.runs is None], int),
+        )
+        object.__setattr__(
+            self,
+            "_related_runs",
+            tuple(item.runs for item in related if item.runs is not None),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def select(
+        self, names: Hashable | Sequence[Hashable] | Literal["all"] = "all"
+    ) -> tuple[SeriesPlan, ...]:
+        if names == "all":
+            return self.series
+        if not isinstance(names, (tuple, list, set)):
+            names = [names]
+        return tuple(self.series[self._index[name]] for name in names)
+
+    def modulators(self, key: Hashable) -> tuple[SeriesPlan, ...]:
+        """The series modulating the voice of the series `key`."""
+        return self._modulators.get(key, ())
+
+    def related_range(self, block: np.ndarray, window: range) -> AbstractValueRange:
+        related = np.concatenate(
+            [block[:, self._related_columns].ravel()]
+            + [_run_values(runs, window)[0] for runs in self._related_runs]
+        )
+        return FixedRange(float(np.nanmin(related)), float(np.nanmax(related)))
+
+    def value_range(
+        self,
+        item: SeriesPlan,
+        block: np.ndarray,
+        window: range,
+        related_range: AbstractValueRange | None = None,
+    ) -> AbstractValueRange:
+        if not item.is_extra:
+            return related_range or self.related_range(block, window)
+        if item.value_range is not None:
+            return item.value_range
+        if item.runs is None:
+            values = block[:, item.column]
+        else:
+            values = _run_values(item.runs, window)[0]
+        return FixedRange(float(np.nanmin(values)), float(np.nanmax(values)))
+
+    def render(
+        self,
+        bounds: slice,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        position: slice | None = None,
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> AudioBuffer:
+        """Render the selected series of a window and mix them down.
+
+        Value ranges are computed over the whole window in `bounds`, while
+        only the rows in `position` (relative to the window) are rendered.
+        """
+        sample = self.mix(bounds, self.select(names), position, duration)
+        kernels.normalize(sample)
+        return sample
+
+    def mix(
+        self,
+        bounds: slice,
+        selected: Sequence[SeriesPlan],
+        position: slice | None = None,
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> AudioBuffer:
+        """Render the given series and add them up, without normalizing."""
+        window = range(len(self))[bounds]
+        rows = window if position is None else window[position]
+        if not selected or not len(rows):
+            return np.ndarray((0, 2), np.float64)  # type: ignore
+
+        block = self.values[bounds]
+        dense_rows = block if position is None else block[position]
+        related_range = None
+        if any(not item.is_extra for item in selected):
+            related_range = self.related_range(block, window)
+
+        sample_size = int(duration.total_seconds() * self.sample_rate)
+        sample = np.zeros((len(rows) * sample_size, 2))
+        for item in selected:
+            if item.renderer.is_silent or item.voice is not None:
+                continue
+            value_range = self.value_range(item, block, window, related_range)
+            values, counts = self.series_values(item, dense_rows, rows)
+            modulators = self.modulators(item.key)
+
+            voice = self.render_series(item, values, counts, value_range, duration)
+            if voice.ndim == 1:
+                if not modulators:
+                    kernels.mix_into(sample, voice, item.channel_gains)
+                    continue
+                voice = np.outer(voice, item.channel_gains)
+
+            for modulator in modulators:
+                values, counts = self.series_values(modulator, dense_rows, rows)
+                envelope = modulator.renderer.envelope(
+                    values=values,
+                    value_range=self.value_range(
+                        modulator, block, window, related_range
+                    ),
+                    duration=duration,
+                    sample_rate=self.sample_rate,
+                    counts=counts,
+                )
+                if envelope is None:
+                    raise TypeError(
+                        f"The renderer of {modulator.key!r} cannot modulate a voice."
+                    )
+                # Not in place, as cached voices are read-only memory maps
+                voice = voice * (
+                    envelope if envelope.ndim == 2 else envelope[:, np.newaxis]
+                )
+            sample += voice
+
+        return sample  # type: ignore
+
+    def render_series(
+        self,
+        item: SeriesPlan,
+        values: np.ndarray,
+        counts: np.ndarray | None,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+    ) -> np.ndarray:
+        """Render one series: a mono wave if it has channel gains, otherwise
+        a stereo buffer. Both are read from the disk cache when possible,
+        as read-only float32 arrays memory-mapped unless it compresses."""
+        key = None
+        if self.cache is not None and item.renderer.cache_key is not None:
+            key = self.cache.key(
+                item.renderer.cache_key,
+                item.channel_gains is not None,
+                float(value_range.min_value),
+                float(value_range.max_value),
+                float(item.frequency_range.min_value),
+                float(item.frequency_range.max_value),
+                duration,
+                self.sample_rate,
+                np.asarray(values, dtype=np.float64),
+                counts,
+            )
+            audio = self.cache.get(key)
+            if audio is not None:
+                return audio
+
+        if item.channel_gains is not None:
+            audio = item.renderer.render_mono(
+                values=values,
+                value_range=value_range,
+                duration=duration,
+                sample_rate=self.sample_rate,
+                frequency_range=item.frequency_range,
+                counts=counts,
+            )
+        elif counts is None:
+            audio = item.renderer.render_values(
+                value_list=values,
+                value_range=value_range,
+                duration=duration,
+                sample_rate=self.sample_rate,
+                frequency_range=item.frequency_range,
+            )
+        else:
+            audio = item.renderer.render_runs(
+                values=values,
+                counts=counts,
+                value_range=value_range,
+                duration=duration,
+                sample_rate=self.sample_rate,
+                frequency_range=item.frequency_range,
+            )
+        if key is not None:
+            self.cache.put(key, audio)  # type: ignore
+        return audio
+
+    def series_values(
+        self, item: SeriesPlan, dense_rows: np.ndarray, rows: range
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """The values of `item` in `rows`, with run lengths if it is encoded."""
+        if item.runs is None:
+            return dense_rows[:, item.column], None
+        return _run_values(item.runs, rows)
@@ -1,20 +1,191 @@
+import threading
+from typing import Literal
+
 import numpy as np
 import pyaudio
 
 from audible_plot.generators import AudioBuffer
 
+SampleFormat = Literal["float32", "int16"]
+
+_FORMATS = {
+    "float32": (np.dtype(np.float32), pyaudio.paFloat32),
+    "int16": (np.dtype(np.int16), pyaudio.paInt16),
+}
+
 
 class AudioPlayer:
-    def __init__(self) -> None:
+    """Plays buffers on the default output device.
+
+    Buffers are written in the device `sample_format`, as C-contiguous
+    interleaved arrays handed to PyAudio through the buffer protocol:
+    buffers already in that format are written as they are, and others
+    are converted a chunk at a time into one reused array, so playing a
+    long render allocates no copy of it. Integer samples can be dithered
+    with triangular noise of one step to avoid quantization distortion.
+
+    The device is opened at `sample_rate`, the rate buffers are rendered
+    at, when it supports it. Otherwise it runs at its default rate and
+    buffers are resampled linearly before being played.
+    """
+
+    # Frames converted at a time for buffers not in the device format
+    chunk_frames = 8192
+
+    def __init__(
+        self,
+        sample_rate: float = 44100,
+        sample_format: SampleFormat = "float32",
+        dither: bool = False,
+    ) -> None:
         self._pyaudio = pyaudio.PyAudio()
+        self._dtype, self._format = _FORMATS[sample_format]
+        self._dither = dither
+        self._rng = np.random.default_rng()
+        self._render_rate = sample_rate
+        self._sample_rate = self._negotiate_rate(int(sample_rate))
+
+    @property
+    def sample_rate(self) -> int:
+        """The rate the device plays at."""
+        return self._sample_rate
+
+    @property
+    def sample_format(self) -> np.dtype:
+        return self._dtype
+
+    def _negotiate_rate(self, sample_rate: int) -> int:
+        try:
+            device = self._pyaudio.get_default_output_device_info()
+        except OSError:
+            # No output device to ask; opening a stream will fail anyway
+            return sample_rate
+        try:
+            self._pyaudio.is_format_supported(
+                sample_rate,
+                output_device=device["index"],
+                output_channels=2,
+                output_format=self._format,
+            )
+        except ValueError:
+            return int(device["defaultSampleRate"])
+        return sample_rate
+
+    def _resample(self, buffer: np.ndarray) -> np.ndarray:
+        if self._sample_rate == self._render_rate or not len(buffer):
+            return buffer
+        step = self._render_rate / self._sample_rate
+        positions = np.arange(int(len(buffer) / step)) * step
+        frames = np.arange(len(buffer))
+        return np.column_stack(
+            [np.interp(positions, frames, buffer[:, channel]) for channel in (0, 1)]
+        )
+
+    def _convert(self, samples: np.ndarray, out: np.ndarray) -> None:
+        """Write float samples into `out`, in the device format."""
+        if self._dtype.kind == "f":
+            out[...] = samples
+            return
+        limit = np.iinfo(self._dtype).max
+        scaled = samples * float(limit)
+        if self._dither:
+            scaled += self._rng.random(scaled.shape)
+            scaled -= self._rng.random(scaled.shape)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -limit - 1, limit, out=scaled)
+        out[...] = scaled
 
     def play_raw(self, buffer: AudioBuffer) -> None:
+        samples = self._resample(np.asarray(buffer))
         stream = self._pyaudio.open(
-            rate=44100,
+            rate=self._sample_rate,
             channels=2,
-            format=pyaudio.paFloat32,
+            format=self._format,
             output=True,
             start=True,
         )
-        stream.write(buffer.astype(np.float32).tobytes())
-        stream.close()
+        try:
+            if samples.dtype == self._dtype and samples.flags.c_contiguous:
+                stream.write(samples, len(samples))
+                return
+            chunk = np.empty((min(len(samples), self.chunk_frames), 2), self._dtype)
+            for start in range(0, len(samples), self.chunk_frames):
+                part = samples[start : start + self.chunk_frames]
+                out = chunk[: len(part)]
+                self._convert(part, out)
+                stream.write(out, len(out))
+        finally:
+            stream.close()
+
+
+class GrainPlayer(AudioPlayer):
+    """Player for short sounds triggered in quick succession, like scrubbing.
+
+    The output stream is opened once and pulls audio from a callback with
+    small buffers, so `play_raw` returns immediately and the new sound
+    starts within one buffer. Each sound replaces the one playing: what is
+    left of it fades out over `fade` samples instead of being cut with a
+    click.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 44100,
+        frames_per_buffer: int = 128,
+        fade: int = 64,
+        sample_format: SampleFormat = "float32",
+        dither: bool = False,
+    ) -> None:
+        super().__init__(sample_rate, sample_format, dither)
+        self._ramp = np.linspace(1, 0, fade, dtype=np.float32)[:, np.newaxis]
+        self._lock = threading.Lock()
+        self._grain = np.zeros((0, 2), np.float32)
+        self._offset = 0
+        # Reused by every callback, as PyAudio copies the samples it returns
+        self._out = np.zeros((frames_per_buffer, 2), self._dtype)
+        self._stream = self._pyaudio.open(
+            rate=self._sample_rate,
+            channels=2,
+            format=self._format,
+            output=True,
+            frames_per_buffer=frames_per_buffer,
+            stream_callback=self._callback,
+            start=True,
+        )
+
+    def play_raw(self, buffer: AudioBuffer) -> None:
+        grain = np.array(self._resample(np.asarray(buffer)), dtype=np.float32)
+        fade = min(len(self._ramp), len(grain))
+        if fade:
+            grain[-fade:] *= self._ramp[-fade:]
+        with self._lock:
+            tail = self._grain[self._offset : self._offset + len(self._ramp)]
+            if len(tail) > len(grain):
+                grain = np.concatenate(
+                    (grain, np.zeros((len(tail) - len(grain), 2), np.float32))
+                )
+            head = grain[: len(tail)]
+            head += tail * self._ramp[: len(tail)]
+            np.clip(head, -1, 1, out=head)
+            self._grain = grain
+            self._offset = 0
+
+    def stop(self) -> None:
+        """Fade out the sound playing, if any."""
+        self.play_raw(np.zeros((0, 2)))  # type: ignore
+
+    def close(self) -> None:
+        self._stream.stop_stream()
+        self._stream.close()
+        self._pyaudio.terminate()
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        if frame_count > len(self._out):
+            self._out = np.zeros((frame_count, 2), self._dtype)
+        out = self._out[:frame_count]
+        with self._lock:
+            chunk = self._grain[self._offset : self._offset + frame_count]
+            self._offset += len(chunk)
+        self._convert(chunk, out[: len(chunk)])
+        out[len(chunk) :] = 0
+        return out, pyaudio.paContinue
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+from collections.abc import Hashable, Sequence
+from dataclasses import replace
+from datetime import timedelta
+from multiprocessing.shared_memory import SharedMemory
+from typing import Literal, Self
+
+import numpy as np
+
+from audible_plot import kernels
+from audible_plot.diskcache import AudioDiskCache
+from audible_plot.generators import AudioBuffer
+from audible_plot.plan import RenderPlan, SeriesPlan
+from audible_plot.runs import RunLengthColumn
+from audible_plot.utils import FixedRange
+
+# Offset, shape and dtype of an array stored in a shared memory block
+_ArrayLayout = tuple[int, tuple[int, ...], str]
+
+# Key of a series, the rows of the window it covers, and for row chunks
+# the series value range and the phase the chunk starts at. Series
+# rendered whole have no range or phase.
+_Task = tuple[Hashable, int, int, tuple[float, float] | None, float]
+
+# Worker state, set up once per process by `_initialize`
+_plan: RenderPlan | None = None
+_columns: SharedMemory | None = None
+
+
+def _publish(arrays: Sequence[np.ndarray]) -> tuple[SharedMemory, list[_ArrayLayout]]:
+    """Copy the arrays into one new shared memory block."""
+    layout = []
+    size = 0
+    for array in arrays:
+        layout.append((size, array.shape, array.dtype.str))
+        # Keep every array aligned to a cache line
+        size += -(-array.nbytes // 64) * 64
+    block = SharedMemory(create=True, size=max(size, 1))
+    for array, view in zip(arrays, _views(block, layout)):
+        view[...] = array
+    return block, layout
+
+
+def _views(block: SharedMemory, layout: list[_ArrayLayout]) -> list[np.ndarray]:
+    return [
+        np.ndarray(shape, np.dtype(dtype), buffer=block.buf, offset=offset)
+        for offset, shape, dtype in layout
+    ]
+
+
+def _initialize(
+    name: str,
+    layout: list[_ArrayLayout],
+    series: tuple[SeriesPlan, ...],
+    runs: dict[int, tuple[int, int, int]],
+    sample_rate: float,
+    cache: AudioDiskCache | None,
+) -> None:
+    global _plan, _columns
+    # Pool workers share the resource tracker of the parent process, which
+    # keeps owning the block; attaching to it does not copy the columns.
+    _columns = SharedMemory(name=name)
+    arrays = _views(_columns, layout)
+    _plan = RenderPlan(
+        values=arrays[0],
+        series=tuple(
+            item
+            if idx not in runs
+            else replace(
+                item,
+                runs=RunLengthColumn(
+                    arrays[runs[idx][0]], arrays[runs[idx][1]], runs[idx][2]
+                ),
+            )
+            for idx, item in enumerate(series)
+        ),
+        sample_rate=sample_rate,
+        cache=cache,
+    )
+
+
+def _render_lane(
+    name: str,
+    shape: tuple[int, int, int],
+    lane: int,
+    bounds: slice,
+    duration: timedelta,
+    tasks: list[_Task],
+) -> None:
+    if _plan is None:
+        raise RuntimeError("The worker process was not initialized.")
+    block = SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, np.float64, buffer=block.buf)[lane]
+        out[...] = 0
+        _render_tasks(_plan, out, bounds, duration, tasks)
+        del out
+    finally:
+        block.close()
+
+
+def _render_tasks(
+    plan: RenderPlan,
+    out: np.ndarray,
+    bounds: slice,
+    duration: timedelta,
+    tasks: list[_Task],
+) -> None:
+    sample_size = int(duration.total_seconds() * plan.sample_rate)
+    rows = plan.values[bounds]
+    for key, start, stop, value_range, phase in tasks:
+        (item,) = plan.select(key)
+        if value_range is None:
+            out += plan.mix(bounds, [item], duration=duration)
+            continue
+
+        # Chunks after the first are rendered from the row before them,
+        # whose segment is dropped, so their first row glides from it
+        first = max(start - 1, 0)
+        values = rows[first:stop, item.column]
+        source_range = FixedRange(*value_range)
+        if first < start:
+            phase -= item.renderer.phase_advances(  # type: ignore
+                values=values[:1],
+                value_range=source_range,
+                duration=duration,
+                sample_rate=plan.sample_rate,
+                frequency_range=item.frequency_range,
+            )[0]
+        wave = item.renderer.render_mono(
+            values=values,
+            value_range=source_range,
+            duration=duration,
+            sample_rate=plan.sample_rate,
+            frequency_range=item.frequency_range,
+            phase=phase,
+        )
+        kernels.mix_into(
+            out[start * sample_size : stop * sample_size],
+            wave[(start - first) * sample_size :],
+            item.channel_gains,
+        )
+
+
+class ProcessPoolRenderer:
+    """Render windows of a plan with a pool of worker processes.
+
+    The plan columns, dense values and run-length encoded runs alike, are
+    copied once into shared memory, and every worker builds its own plan
+    over them when it starts. Renders then only send workers small task
+    descriptors: a series key, the rows of the window to render, and for
+    row chunks the value range and starting phase.
+
+    Mono series whose renderer has `phase_advances` are split into row
+    chunks rendered in parallel, each starting at the phase the whole wave
+    has there, so large windows of a few series scale too. Other series
+    (stereo, run-length encoded or modulated) are rendered whole by one
+    worker. Tasks are grouped in one lane per worker, each writing into
+    its own layer of a shared output buffer, which the layers are summed
+    from. The output equals `RenderPlan.render` up to rounding.
+
+    Renderers are sent to the workers when the pool starts, so they must
+    be picklable unless processes are forked (the default on Linux).
+    """
+
+    def __init__(
+        self,
+        plan: RenderPlan,
+        processes: int | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        self._plan = plan
+        self._processes = processes or os.cpu_count() or 1
+        arrays = [plan.values]
+        runs = {}
+        for idx, item in enumerate(plan.series):
+            if item.runs is not None:
+                runs[idx] = (len(arrays), len(arrays) + 1, item.runs.length)
+                arrays += [item.runs.starts, item.runs.values]
+        self._columns, layout = _publish(arrays)
+        try:
+            self._pool = multiprocessing.get_context(start_method).Pool(
+                self._processes,
+                initializer=_initialize,
+                initargs=(
+                    self._columns.name,
+                    layout,
+                    tuple(
+                        item if item.runs is None else replace(item, runs=None)
+                        for item in plan.series
+                    ),
+                    runs,
+                    plan.sample_rate,
+                    plan.cache,
+                ),
+            )
+        except BaseException:
+            self._columns.close()
+            self._columns.unlink()
+            raise
+
+    @property
+    def plan(self) -> RenderPlan:
+        return self._plan
+
+    @property
+    def processes(self) -> int:
+        return self._processes
+
+    def close(self) -> None:
+        """Stop the workers and release the shared columns."""
+        self._pool.close()
+        self._pool.join()
+        self._columns.close()
+        self._columns.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def render(
+        self,
+        bounds: slice,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> AudioBuffer:
+        plan = self._plan
+        window = range(len(plan))[bounds]
+        selected = [
+            item
+            for item in plan.select(names)
+            if not item.renderer.is_silent and item.voice is None
+        ]
+        if window.step != 1 or not selected or not len(window):
+            return plan.render(bounds, names, duration=duration)
+
+        tasks = self._tasks(bounds, window, selected, duration)
+        lanes = _balance(tasks, min(self._processes, len(tasks)))
+        sample_size = int(duration.total_seconds() * plan.sample_rate)
+        shape = (len(lanes), len(window) * sample_size, 2)
+        block = SharedMemory(create=True, size=max(math.prod(shape) * 8, 1))
+        try:
+            self._pool.starmap(
+                _render_lane,
+                [
+                    (block.name, shape, lane, bounds, duration, lane_tasks)
+                    for lane, lane_tasks in enumerate(lanes)
+                ],
+            )
+            layers = np.ndarray(shape, np.float64, buffer=block.buf)
+            sample = layers.sum(axis=0)
+            del layers
+        finally:
+            block.close()
+            block.unlink()
+        kernels.normalize(sample)
+        return sample  # type: ignore
+
+    def _tasks(
+        self,
+        bounds: slice,
+        window: range,
+        selected: list[SeriesPlan],
+        duration: timedelta,
+    ) -> list[_Task]:
+        plan = self._plan
+        block = plan.values[bounds]
+        related_range = None
+        if any(not item.is_extra for item in selected):
+            related_range = plan.related_range(block, window)
+        chunk_rows = -(-len(window) // self._processes)
+
+        tasks: list[_Task] = []
+        for item in selected:
+            advances = None
+            if (
+                item.channel_gains is not None
+                and item.runs is None
+                and not plan.modulators(item.key)
+            ):
+                value_range = plan.value_range(item, block, window, related_range)
+                advances = item.renderer.phase_advances(
+                    values=block[:, item.column],
+                    value_range=value_range,
+                    duration=duration,
+                    sample_rate=plan.sample_rate,
+                    frequency_range=item.frequency_range,
+                )
+            if advances is None:
+                tasks.append((item.key, 0, len(window), None, 0.0))
+                continue
+            phases = np.concatenate(([0.0], np.cumsum(advances)))
+            for start in range(0, len(window), chunk_rows):
+                tasks.append(
+                    (
+                        item.key,
+                        start,
+                        min(start + chunk_rows, len(window)),
+                        (float(value_range.min_value), float(value_range.max_value)),
+                        float(phases[start]),
+                    )
+                )
+        return tasks
+
+
+def _balance(tasks: list[_Task], lanes: int) -> list[list[_Task]]:
+    """Spread the tasks over lanes, longest first into the least loaded."""
+    assigned: list[list[_Task]] = [[] for _ in range(lanes)]
+    loads = [0] * lanes
+    for task in sorted(tasks, key=lambda task: task[1] - task[2]):
+        lane = loads.index(min(loads))
+        assigned[lane].append(task)
+        loads[lane] += task[2] - task[1]
+    return assigned
@@ -1,20 +1,148 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Callable, Sequence
+from typing import Callable, NamedTuple, Sequence
 
 from audible_plot.generators import AudioBuffer, ToneGenerator
+from audible_plot import kernels
 from audible_plot.utils import (
     AbstractValueRange,
+    FixedRange,
     ValueMapper,
     adjust_volume,
     concat_samples,
     pan_audio,
+    pan_gains,
 )
 import numpy as np
 
 
+class Tones(NamedTuple):
+    """One flat tone per value, as laid out on a timeline."""
+
+    frequency: np.ndarray
+    # Left and right gains of each tone, zero for silent values
+    gains: np.ndarray
+    wave_type: np.ndarray
+
+
+def _flat_tones(
+    frequency: np.ndarray, gains: np.ndarray, generator: ToneGenerator
+) -> Tones:
+    return Tones(
+        frequency, gains, np.full(len(frequency), int(generator.wave_type), np.int64)
+    )
+
+
 class AbstractDataRenderer(ABC):
+    @property
+    def frequency_range(self) -> AbstractValueRange | None:
+        """The renderer's own frequency range, overriding the chart one if set."""
+        return None
+
+    @property
+    def channel_gains(self) -> np.ndarray | None:
+        """Left and right gains applied to `render_mono` output.
+
+        Renderers returning `None` produce their stereo output through
+        `render_values` instead.
+        """
+        return None
+
+    @property
+    def is_silent(self) -> bool:
+        """Whether the renderer always outputs silence, so it can be skipped."""
+        return False
+
+    @property
+    def cache_key(self) -> tuple | None:
+        """The renderer parameters, identifying its output in a disk cache.
+
+        Renderers returning `None` (the default) are never cached.
+        """
+        return None
+
+    def envelope(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        counts: np.ndarray | None = None,
+    ) -> np.ndarray | None:
+        """Per-sample gains applied to the voice this series modulates.
+
+        Returns one gain per sample, or a left and right gain per sample,
+        covering `duration` for each value (repeated `counts` times). `None`
+        means the renderer cannot modulate another series.
+        """
+        return None
+
+    def tones(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> Tones | None:
+        """The flat tone sounding each value, for event schedules.
+
+        `None` (the default) means the renderer output cannot be described
+        as one tone per value.
+        """
+        return None
+
+    def render_mono(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+        counts: np.ndarray | None = None,
+        phase: float = 0.0,
+    ) -> np.ndarray:
+        raise NotImplementedError
+
+    def phase_advances(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> np.ndarray | None:
+        """The phase, in radians, that `render_mono` advances over each value.
+
+        Renderers returning an array let windows be rendered piecewise: a
+        wave starting at the sum of the advances of the previous values is
+        the continuation of their wave. `None` means the output is not a
+        function of a running phase.
+        """
+        return None
+
+    def render_mono_rows(
+        self,
+        values: np.ndarray,
+        source_min: np.ndarray,
+        source_max: np.ndarray,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> np.ndarray:
+        """Render each row of `values` with its own source value range."""
+        return np.vstack(
+            [
+                self.render_mono(
+                    values=row,
+                    value_range=FixedRange(low, high),
+                    duration=duration,
+                    sample_rate=sample_rate,
+                    frequency_range=frequency_range,
+                )
+                for row, low, high in zip(values, source_min, source_max)
+            ]
+        )
+
     @abstractmethod
     def render(
         self,
@@ -48,6 +176,24 @@ class AbstractDataRenderer(ABC):
             sample_rate=sample_rate,
         )
 
+    def render_runs(
+        self,
+        values: np.ndarray,
+        counts: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        """Render each value repeated `counts` times, one run at a time."""
+        return self.render_values(
+            value_list=np.repeat(values, counts),
+            value_range=value_range,
+            duration=duration,
+            sample_rate=sample_rate,
+            frequency_range=frequency_range,
+        )
+
 
 class PitchDataRenderer(AbstractDataRenderer):
     def __init__(
@@ -64,7 +210,6 @@ class PitchDataRenderer(AbstractDataRenderer):
         self._freq_range = frequency_range
         self._max_limit_perc = max_limit_perc
         self._generator = generator
-        self._old_value = None
         self._enable_transitions = enable_transitions
         self._pan = pan
         self._volume = volume
@@ -93,47 +238,505 @@ class PitchDataRenderer(AbstractDataRenderer):
             self._volume,
         )
 
-    def render_values(
+    @property
+    def frequency_range(self) -> AbstractValueRange | None:
+        return self._freq_range
+
+    @property
+    def channel_gains(self) -> np.ndarray:
+        return pan_gains(self._pan, self._volume)
+
+    @property
+    def cache_key(self) -> tuple:
+        return (
+            type(self).__name__,
+            int(self._generator.wave_type),
+            self._max_limit_perc,
+            self._enable_transitions,
+            self._pan,
+            self._volume,
+        )
+
+    def render_mono(
         self,
-        value_list: Sequence[float],
+        values: np.ndarray,
         value_range: AbstractValueRange,
         duration: timedelta,
         sample_rate: float,
         frequency_range: AbstractValueRange,
-    ) -> AudioBuffer:
+        counts: np.ndarray | None = None,
+        phase: float = 0.0,
+    ) -> np.ndarray:
+        return self._generator.synthesize(
+            sample_rate=sample_rate,
+            duration=duration,
+            freq_points=self._freq_points(values, value_range, frequency_range),
+            sliding=self._enable_transitions,
+            counts=counts,
+            phase=phase,
+        )
+
+    def phase_advances(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> np.ndarray:
+        return self._generator.phase_advances(
+            sample_rate=sample_rate,
+            duration=duration,
+            freq_points=self._freq_points(values, value_range, frequency_range),
+            sliding=self._enable_transitions,
+        )
+
+    def tones(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> Tones:
+        freq_range = self._freq_range or frequency_range
+        frequency = ValueMapper(
+            value_range, freq_range, self._max_limit_perc
+        ).map_values(values)
+        return _flat_tones(
+            frequency, np.tile(self.channel_gains, (len(frequency), 1)), self._generator
+        )
+
+    def _freq_points(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> np.ndarray:
         freq_range = self._freq_range or frequency_range
         mapper = ValueMapper(value_range, freq_range, self._max_limit_perc)
-        # Duplicate the first value to ensure it is rendered correctly:
-        value_list = list(value_list)
+        mapped_values = mapper.map_values(values)
         if self._enable_transitions:
-            value_list.insert(0, value_list[0])
-        mapped_values = [mapper.map_value(value) for value in value_list]
+            # Duplicate the first value to ensure it is rendered correctly:
+            mapped_values = np.concatenate((mapped_values[:1], mapped_values))
+        return mapped_values
+
+    def render_mono_rows(
+        self,
+        values: np.ndarray,
+        source_min: np.ndarray,
+        source_max: np.ndarray,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> np.ndarray:
+        freq_range = self._freq_range or frequency_range
+        mapped_values = kernels.map_linear_rows(
+            np.asarray(values, dtype=np.float64),
+            np.asarray(source_min, dtype=np.float64),
+            np.asarray(source_max, dtype=np.float64),
+            float(freq_range.min_value),
+            float(freq_range.max_value),
+            -1.0 if self._max_limit_perc is None else self._max_limit_perc,
+        )
         if self._enable_transitions:
-            sample = self._generator.generate_sliding(
-                sample_rate=sample_rate,
-                duration=duration,
-                freq_points=mapped_values,
+            mapped_values = np.concatenate(
+                (mapped_values[:, :1], mapped_values), axis=1
             )
-        else:
-            sample = self._generator.generate_fixed(
-                sample_rate=sample_rate,
-                duration=duration,
-                freq_points=mapped_values,
+        return self._generator.synthesize_rows(
+            sample_rate=sample_rate,
+            duration=duration,
+            freq_points=mapped_values,
+            sliding=self._enable_transitions,
+        )
+
+    def render_values(
+        self,
+        value_list: Sequence[float],
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        wave = self.render_mono(
+            values=np.asarray(value_list, dtype=np.float64),
+            value_range=value_range,
+            duration=duration,
+            sample_rate=sample_rate,
+            frequency_range=frequency_range,
+        )
+        return np.outer(wave, self.channel_gains)  # type: ignore
+
+    def render_runs(
+        self,
+        values: np.ndarray,
+        counts: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        wave = self.render_mono(
+            values=values,
+            value_range=value_range,
+            duration=duration,
+            sample_rate=sample_rate,
+            frequency_range=frequency_range,
+            counts=counts,
+        )
+        return np.outer(wave, self.channel_gains)  # type: ignore
+
+
+class _EnvelopeRenderer(AbstractDataRenderer):
+    """A fixed tone shaped by a per-sample envelope computed from the values.
+
+    Set as the renderer of a series with a `voice`, only the envelope is
+    used, applied to the voice's output.
+    """
+
+    def __init__(
+        self,
+        *,
+        generator: ToneGenerator,
+        frequency: float = 440.0,
+        pan: float = 0,
+        volume: float = 1.0,
+        ramp: int = 64,
+    ) -> None:
+        super().__init__()
+        self._generator = generator
+        self._frequency = frequency
+        self._pan = pan
+        self._volume = volume
+        # Samples over which the envelope moves from one value to the next
+        self._ramp = ramp
+
+    @abstractmethod
+    def envelope(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        counts: np.ndarray | None = None,
+    ) -> np.ndarray:
+        raise NotImplementedError
+
+    @property
+    def channel_gains(self) -> np.ndarray | None:
+        return pan_gains(self._pan, self._volume)
+
+    @property
+    def cache_key(self) -> tuple:
+        return (
+            type(self).__name__,
+            int(self._generator.wave_type),
+            self._frequency,
+            self._pan,
+            self._volume,
+            self._ramp,
+            *self._parameters(),
+        )
+
+    def _parameters(self) -> tuple:
+        """Subclass parameters shaping the envelope, for `cache_key`."""
+        return ()
+
+    def render(
+        self,
+        value: float,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        return self.render_values(
+            [value], value_range, duration, sample_rate, frequency_range
+        )
+
+    def render_mono(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+        counts: np.ndarray | None = None,
+        phase: float = 0.0,
+    ) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        segments = len(values) if counts is None else int(np.sum(counts))
+        tone = self._generator.synthesize(
+            sample_rate=sample_rate,
+            duration=duration,
+            freq_points=[self._frequency],
+            counts=np.array([segments]),
+            phase=phase,
+        )
+        tone *= self.envelope(values, value_range, duration, sample_rate, counts)
+        return tone
+
+    def render_values(
+        self,
+        value_list: Sequence[float],
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        return self.render_runs(
+            np.asarray(value_list, dtype=np.float64),
+            np.ones(len(value_list), np.int64),
+            value_range,
+            duration,
+            sample_rate,
+            frequency_range,
+        )
+
+    def render_runs(
+        self,
+        values: np.ndarray,
+        counts: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        wave = self.render_mono(
+            values=values,
+            value_range=value_range,
+            duration=duration,
+            sample_rate=sample_rate,
+            frequency_range=frequency_range,
+            counts=counts,
+        )
+        return np.outer(wave, self.channel_gains)  # type: ignore
+
+    def _levels(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        target: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        counts: np.ndarray | None,
+    ) -> np.ndarray:
+        """Map the values into `target` and hold them for their segments."""
+        return kernels.hold_envelope(
+            self._value_levels(values, value_range, target),
+            np.ones(len(values), np.int64) if counts is None else counts,
+            int(duration.total_seconds() * sample_rate),
+            self._ramp,
+        )
+
+    def _value_levels(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        target: AbstractValueRange,
+    ) -> np.ndarray:
+        return np.clip(
+            ValueMapper(value_range, target).map_values(values),
+            min(target.min_value, target.max_value),
+            max(target.min_value, target.max_value),
+        )
+
+    def _steady_tones(self, gains: np.ndarray) -> Tones:
+        """The renderer's own tone for every value, with per-value gains."""
+        return _flat_tones(np.full(len(gains), self._frequency), gains, self._generator)
+
+
+class AmplitudeDataRenderer(_EnvelopeRenderer):
+    """Encodes values as loudness, from `gain_range.min_value` for the
+    lowest value of the range to `gain_range.max_value` for the highest
+    (0.1 to 1 by default)."""
+
+    def __init__(
+        self,
+        *,
+        generator: ToneGenerator,
+        gain_range: AbstractValueRange | None = None,
+        frequency: float = 440.0,
+        pan: float = 0,
+        volume: float = 1.0,
+        ramp: int = 64,
+    ) -> None:
+        super().__init__(
+            generator=generator,
+            frequency=frequency,
+            pan=pan,
+            volume=volume,
+            ramp=ramp,
+        )
+        self._gain_range = gain_range or FixedRange(0.1, 1)
+
+    def _parameters(self) -> tuple:
+        return (self._gain_range.min_value, self._gain_range.max_value)
+
+    def envelope(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        counts: np.ndarray | None = None,
+    ) -> np.ndarray:
+        return self._levels(
+            values, value_range, self._gain_range, duration, sample_rate, counts
+        )
+
+    def tones(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> Tones:
+        levels = self._value_levels(values, value_range, self._gain_range)
+        return self._steady_tones(np.outer(levels, self.channel_gains))
+
+
+class PulseDataRenderer(_EnvelopeRenderer):
+    """Encodes values as a pulse rate, in pulses per second within
+    `rate_range` (2 to 16 by default); each pulse lasts `duty` of its period."""
+
+    def __init__(
+        self,
+        *,
+        generator: ToneGenerator,
+        rate_range: AbstractValueRange | None = None,
+        duty: float = 0.5,
+        frequency: float = 440.0,
+        pan: float = 0,
+        volume: float = 1.0,
+        ramp: int = 64,
+    ) -> None:
+        super().__init__(
+            generator=generator,
+            frequency=frequency,
+            pan=pan,
+            volume=volume,
+            ramp=ramp,
+        )
+        self._rate_range = rate_range or FixedRange(2, 16)
+        self._duty = duty
+
+    def _parameters(self) -> tuple:
+        return (self._rate_range.min_value, self._rate_range.max_value, self._duty)
+
+    def envelope(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        counts: np.ndarray | None = None,
+    ) -> np.ndarray:
+        rates = np.clip(
+            ValueMapper(value_range, self._rate_range).map_values(values),
+            self._rate_range.min_value,
+            self._rate_range.max_value,
+        )
+        return kernels.pulse_gate(
+            rates,
+            np.ones(len(rates), np.int64) if counts is None else counts,
+            int(duration.total_seconds() * sample_rate),
+            float(sample_rate),
+            self._duty,
+            self._ramp,
+        )
+
+
+class PanDataRenderer(_EnvelopeRenderer):
+    """Encodes values as stereo position, from `pan_range.min_value` for
+    the lowest value of the range to `pan_range.max_value` for the highest
+    (-1 is fully left and 1 fully right)."""
+
+    def __init__(
+        self,
+        *,
+        generator: ToneGenerator,
+        pan_range: AbstractValueRange | None = None,
+        frequency: float = 440.0,
+        volume: float = 1.0,
+        ramp: int = 64,
+    ) -> None:
+        super().__init__(
+            generator=generator, frequency=frequency, volume=volume, ramp=ramp
+        )
+        self._pan_range = pan_range or FixedRange(-1, 1)
+
+    def _parameters(self) -> tuple:
+        return (self._pan_range.min_value, self._pan_range.max_value)
+
+    @property
+    def channel_gains(self) -> np.ndarray | None:
+        # Panning changes per sample, so the output is rendered in stereo
+        return None
+
+    def envelope(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        counts: np.ndarray | None = None,
+    ) -> np.ndarray:
+        return kernels.pan_envelope(
+            self._levels(
+                values, value_range, self._pan_range, duration, sample_rate, counts
             )
+        )
 
-        return adjust_volume(
-            buffer=pan_audio(
-                buffer=sample,
-                pan=self._pan,
-            ),
-            volume=self._volume,
+    def tones(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> Tones:
+        pans = self._value_levels(values, value_range, self._pan_range)
+        return self._steady_tones(
+            kernels.pan_envelope(pans) * (self._volume / np.sqrt(2))
+        )
+
+    def render_runs(
+        self,
+        values: np.ndarray,
+        counts: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        tone = self._generator.synthesize(
+            sample_rate=sample_rate,
+            duration=duration,
+            freq_points=[self._frequency],
+            counts=np.array([int(np.sum(counts))]),
         )
+        envelope = self.envelope(values, value_range, duration, sample_rate, counts)
+        # Pan gains are 1 at the center, so scale them back to the
+        # constant power law
+        return tone[:, np.newaxis] * envelope * (self._volume / np.sqrt(2))  # type: ignore
 
 
 class SilentRenderer(AbstractDataRenderer):
     def __init__(self) -> None:
         super().__init__()
 
+    @property
+    def is_silent(self) -> bool:
+        return True
+
+    def tones(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> Tones:
+        return Tones(
+            np.zeros(len(values)),
+            np.zeros((len(values), 2)),
+            np.zeros(len(values), np.int64),
+        )
+
     def render(
         self,
         value: float,
@@ -144,6 +747,18 @@ class SilentRenderer(AbstractDataRenderer):
     ) -> AudioBuffer:
         return np.zeros((int(duration.total_seconds() * sample_rate), 2))  # type: ignore
 
+    def render_runs(
+        self,
+        values: np.ndarray,
+        counts: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        sample_size = int(duration.total_seconds() * sample_rate)
+        return np.zeros((int(np.sum(counts)) * sample_size, 2))  # type: ignore
+
 
 @dataclass(kw_only=True, frozen=True)
 class ConditionalRenderer(AbstractDataRenderer):
@@ -173,3 +788,58 @@ class ConditionalRenderer(AbstractDataRenderer):
         return renderer.render(
             value, value_range, duration, sample_rate, frequency_range
         )
+
+    def render_runs(
+        self,
+        values: np.ndarray,
+        counts: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        sample_rate: float,
+        frequency_range: AbstractValueRange,
+    ) -> AudioBuffer:
+        # Each run is one continuous tone (or silence) instead of one per value
+        buffers = []
+        for value, count in zip(values, counts):
+            if self.condition(value):
+                if self.mapper:
+                    value = self.mapper(value)
+                renderer = self.renderer
+            else:
+                renderer = self.else_renderer or SilentRenderer()
+            buffers.append(
+                renderer.render_runs(
+                    np.array([value]),
+                    np.array([count]),
+                    value_range,
+                    duration,
+                    sample_rate,
+                    frequency_range,
+                )
+            )
+        return concat_samples(*buffers, sample_rate=sample_rate)
+
+    def tones(
+        self,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        frequency_range: AbstractValueRange,
+    ) -> Tones | None:
+        values = np.asarray(values, dtype=np.float64)
+        chosen = np.fromiter(
+            (bool(self.condition(value)) for value in values), bool, len(values)
+        )
+        mapped = values.copy()
+        if self.mapper:
+            mapped[chosen] = [self.mapper(value) for value in values[chosen]]
+        first = self.renderer.tones(mapped, value_range, frequency_range)
+        second = (self.else_renderer or SilentRenderer()).tones(
+            values, value_range, frequency_range
+        )
+        if first is None or second is None:
+            return None
+        return Tones(
+            np.where(chosen, first.frequency, second.frequency),
+            np.where(chosen[:, np.newaxis], first.gains, second.gains),
+            np.where(chosen, first.wave_type, second.wave_type),
+        )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Columns whose runs are at least this long on average are stored encoded.
+MIN_AVERAGE_RUN_LENGTH = 4
+
+
+@dataclass(frozen=True, eq=False)
+class RunLengthColumn:
+    """A column stored as runs of identical values.
+
+    `starts` holds the position where each run begins and `values` the
+    value repeated along it; the run ends where the next one starts.
+    """
+
+    starts: np.ndarray
+    values: np.ndarray
+    length: int
+
+    @classmethod
+    def encode(cls, values: np.ndarray) -> RunLengthColumn:
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return cls(np.empty(0, np.int64), np.empty(0), 0)
+        previous = values[:-1]
+        following = values[1:]
+        same = (previous == following) | (np.isnan(previous) & np.isnan(following))
+        starts = np.concatenate(([0], np.flatnonzero(~same) + 1))
+        return cls(starts, values[starts], len(values))
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(np.append(self.starts, self.length))
+
+    @property
+    def average_run_length(self) -> float:
+        if not len(self.starts):
+            return 0
+        return self.length / len(self.starts)
+
+    @property
+    def is_step_like(self) -> bool:
+        return self.average_run_length >= MIN_AVERAGE_RUN_LENGTH
+
+    def decode(self) -> np.ndarray:
+        return np.repeat(self.values, self.counts)
+
+    def take(self, positions: np.ndarray) -> np.ndarray:
+        """Return the values at `positions`."""
+        return self.values[np.searchsorted(self.starts, positions, side="right") - 1]
+
+    def runs(self, bounds: slice) -> tuple[np.ndarray, np.ndarray]:
+        """Return the values and lengths of the runs clipped to `bounds`."""
+        start, stop, step = bounds.indices(self.length)
+        if step != 1:
+            raise ValueError("Run-length columns only support contiguous slices.")
+        if stop <= start:
+            return np.empty(0), np.empty(0, np.int64)
+        first = np.searchsorted(self.starts, start, side="right") - 1
+        last = np.searchsorted(self.starts, stop, side="left")
+        run_starts = self.starts[first:last].copy()
+        run_starts[0] = start
+        run_ends = np.append(self.starts[first + 1 : last], stop)
+        return self.values[first:last], run_ends - run_starts
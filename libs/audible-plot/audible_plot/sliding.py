@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Literal
+
+import numpy as np
+
+from audible_plot import kernels
+from audible_plot.generators import AudioBuffer
+from audible_plot.plan import RenderPlan, SeriesPlan
+from audible_plot.utils import AbstractValueRange
+
+
+@dataclass(frozen=True, eq=False)
+class _RetainedWave:
+    # Everything the wave depends on besides the rows it covers
+    signature: tuple
+    rows: range
+    wave: np.ndarray
+    # Phase at the start of each row, plus the phase at the end of the wave
+    phases: np.ndarray
+
+
+class SlidingRenderCache:
+    """Render consecutive windows of a plan reusing the audio they share.
+
+    The last mono wave rendered for each series is retained with the phase
+    at every row boundary. When the next window of the series overlaps it
+    with the same value range, only the rows outside the overlap are
+    synthesized, starting (or ending) at the phase of the retained wave
+    they join, so the result is continuous. Waves are thus equal to a
+    fresh render up to a constant phase offset, and the synthesis cost of
+    moving a window by a few rows no longer depends on its size.
+
+    Series whose value range changes are rendered again in full, as are
+    run-length encoded series, modulated voices and renderers without
+    `phase_advances`.
+
+    The cache can be used from several threads: retained waves are never
+    modified, only replaced under a lock, so concurrent renders are
+    correct, although windows far apart evict each other's audio. Give
+    each listening session its own cache to keep its reuse.
+    """
+
+    def __init__(self, plan: RenderPlan) -> None:
+        self._plan = plan
+        self._lock = threading.Lock()
+        self._retained: dict[Hashable, _RetainedWave] = {}
+
+    @property
+    def plan(self) -> RenderPlan:
+        return self._plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._retained.clear()
+
+    def render(
+        self,
+        bounds: slice,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> AudioBuffer:
+        plan = self._plan
+        selected = plan.select(names)
+        window = range(len(plan))[bounds]
+        if window.step != 1 or not selected or not len(window):
+            return plan.render(bounds, names, duration=duration)
+
+        block = plan.values[bounds]
+        related_range = None
+        if any(not item.is_extra for item in selected):
+            related_range = plan.related_range(block, window)
+
+        sample_size = int(duration.total_seconds() * plan.sample_rate)
+        sample = np.zeros((len(window) * sample_size, 2))
+        rest = []
+        for item in selected:
+            if item.renderer.is_silent or item.voice is not None:
+                continue
+            wave = None
+            if (
+                item.channel_gains is not None
+                and item.runs is None
+                and not plan.modulators(item.key)
+            ):
+                wave = self._wave(
+                    item,
+                    block[:, item.column],
+                    window,
+                    plan.value_range(item, block, window, related_range),
+                    duration,
+                )
+            if wave is None:
+                rest.append(item)
+            else:
+                kernels.mix_into(sample, wave, item.channel_gains)
+
+        if rest:
+            sample += plan.mix(bounds, rest, duration=duration)
+        kernels.normalize(sample)
+        return sample  # type: ignore
+
+    def _wave(
+        self,
+        item: SeriesPlan,
+        values: np.ndarray,
+        window: range,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+    ) -> np.ndarray | None:
+        signature = (
+            item.renderer,
+            value_range.min_value,
+            value_range.max_value,
+            item.frequency_range.min_value,
+            item.frequency_range.max_value,
+            duration,
+        )
+        with self._lock:
+            retained = self._retained.get(item.key)
+        if retained is not None and retained.signature == signature:
+            wave = self._extend(item, values, window, value_range, duration, retained)
+            if wave is not None:
+                return wave
+
+        advances = self._advances(item, values, value_range, duration)
+        if advances is None:
+            return None
+        wave = self._plan.render_series(item, values, None, value_range, duration)
+        self._retain(
+            item.key,
+            _RetainedWave(
+                signature, window, wave, np.concatenate(([0.0], np.cumsum(advances)))
+            ),
+        )
+        return wave
+
+    def _extend(
+        self,
+        item: SeriesPlan,
+        values: np.ndarray,
+        window: range,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        retained: _RetainedWave,
+    ) -> np.ndarray | None:
+        start, stop = window.start, window.stop
+        offset = retained.rows.start
+        # The first shared row is rendered again: whether a row glides from
+        # the previous one depends on it being the first of its window.
+        keep_start = max(offset, start) + 1
+        keep_stop = min(retained.rows.stop, stop)
+        if keep_stop <= keep_start:
+            return None
+
+        sample_size = int(duration.total_seconds() * self._plan.sample_rate)
+        waves = []
+        phases = []
+
+        left = values[: keep_start - start]
+        advances = self._advances(item, left, value_range, duration)
+        if advances is None:
+            return None
+        phase = retained.phases[keep_start - offset] - advances.sum()
+        waves.append(self._synthesize(item, left, value_range, duration, phase))
+        phases.append(phase + np.concatenate(([0.0], np.cumsum(advances[:-1]))))
+
+        waves.append(
+            retained.wave[
+                (keep_start - offset) * sample_size : (keep_stop - offset) * sample_size
+            ]
+        )
+        phases.append(retained.phases[keep_start - offset : keep_stop - offset])
+
+        phase = retained.phases[keep_stop - offset]
+        if keep_stop < stop:
+            # Rendered from the last shared row, so the first new row glides
+            # from it; that row's segment is then dropped.
+            right = values[keep_stop - 1 - start :]
+            advances = self._advances(item, right, value_range, duration)
+            waves.append(
+                self._synthesize(
+                    item, right, value_range, duration, phase - advances[0]
+                )[sample_size:]
+            )
+            phases.append(phase + np.concatenate(([0.0], np.cumsum(advances[1:]))))
+        else:
+            phases.append([phase])
+
+        wave = np.concatenate(waves)
+        self._retain(
+            item.key,
+            _RetainedWave(retained.signature, window, wave, np.concatenate(phases)),
+        )
+        return wave
+
+    def _retain(self, key: Hashable, retained: _RetainedWave) -> None:
+        with self._lock:
+            self._retained[key] = retained
+
+    def _advances(
+        self,
+        item: SeriesPlan,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+    ) -> np.ndarray | None:
+        return item.renderer.phase_advances(
+            values=values,
+            value_range=value_range,
+            duration=duration,
+            sample_rate=self._plan.sample_rate,
+            frequency_range=item.frequency_range,
+        )
+
+    def _synthesize(
+        self,
+        item: SeriesPlan,
+        values: np.ndarray,
+        value_range: AbstractValueRange,
+        duration: timedelta,
+        phase: float,
+    ) -> np.ndarray:
+        return item.renderer.render_mono(
+            values=values,
+            value_range=value_range,
+            duration=duration,
+            sample_rate=self._plan.sample_rate,
+            frequency_range=item.frequency_range,
+            phase=phase,
+        )
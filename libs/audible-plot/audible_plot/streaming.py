@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping, Sequence
+from datetime import timedelta
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from audible_plot.chart import AudibleChart, SeriesConfig
+from audible_plot.generators import AudioBuffer
+from audible_plot.indicators import StreamingIndicator
+from audible_plot.plan import RenderPlan, SeriesPlan
+from audible_plot.player import AudioPlayer
+from audible_plot.utils import AbstractValueRange
+
+
+class StreamingChart:
+    """A chart fed one row at a time, with indicators updated incrementally.
+
+    Rows and indicator outputs are stored in a buffer that grows
+    geometrically, so appending a row costs O(1) amortized. Indicator keys
+    become series like the input columns and are configured with the same
+    `SeriesConfig` objects; rendering the latest rows only touches those
+    rows, whatever the length of the history. Values are stored with
+    `dtype`, which can be set to `np.float32` to halve the memory used.
+    """
+
+    def __init__(
+        self,
+        *,
+        columns: Sequence[Hashable],
+        indicators: Sequence[StreamingIndicator] = (),
+        config: Sequence[SeriesConfig] = (),
+        sample_rate: float = 44100,
+        frequency_range: AbstractValueRange,
+        capacity: int = 1024,
+        dtype: npt.DTypeLike = np.float64,
+        player: AudioPlayer | None = None,
+    ) -> None:
+        keys = [*columns, *(key for item in indicators for key in item.keys)]
+        if len(set(keys)) != len(keys):
+            raise TypeError("Column and indicator keys must be unique.")
+        self._keys = {key: column for column, key in enumerate(keys)}
+        for item in config:
+            if item.key not in self._keys:
+                raise TypeError(f"Config key {item.key!r} is not a chart column.")
+
+        self._indicators = list(indicators)
+        self._config = list(config)
+        self._values = np.full((max(capacity, 1), len(keys)), np.nan, dtype)
+        self._labels: list[Hashable] = []
+        self._sample_rate = sample_rate
+        self._frequency_range = frequency_range
+        self._player = player or AudioPlayer(sample_rate)
+        self._series = tuple(
+            SeriesPlan(
+                key=item.key,
+                column=self._keys[item.key],
+                renderer=item.renderer,
+                value_range=item.range,
+                frequency_range=item.renderer.frequency_range or frequency_range,
+                is_extra=item.is_extra or item.range is not None,
+                channel_gains=item.renderer.channel_gains,
+                voice=item.voice,
+            )
+            for item in config
+        )
+
+    @property
+    def keys(self) -> list[Hashable]:
+        return list(self._keys)
+
+    @property
+    def player(self):
+        return self._player
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def append(
+        self, row: Mapping[Hashable, float], label: Hashable | None = None
+    ) -> dict[Hashable, float]:
+        """Add a row, updating every indicator, and return the stored values.
+
+        Indicators are updated in order and see the outputs of the previous
+        ones, so they can be chained (e.g. a crossover of MACD outputs).
+        """
+        values = dict(row)
+        for indicator in self._indicators:
+            values.update(zip(indicator.keys, indicator.update(values)))
+
+        length = len(self._labels)
+        if length == len(self._values):
+            grown = np.full(
+                (2 * length, self._values.shape[1]), np.nan, self._values.dtype
+            )
+            grown[:length] = self._values
+            self._values = grown
+        self._values[length] = [values.get(key, np.nan) for key in self._keys]
+        self._labels.append(length if label is None else label)
+        return {key: values.get(key, np.nan) for key in self._keys}
+
+    @property
+    def plan(self) -> RenderPlan:
+        """A render plan over the rows appended so far."""
+        return RenderPlan(
+            values=self._values[: len(self._labels)],
+            series=self._series,
+            sample_rate=self._sample_rate,
+        )
+
+    def render(
+        self,
+        window_bounds: slice | None = None,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        position: slice | int | None = None,
+        duration: timedelta = timedelta(seconds=0.5),
+    ) -> AudioBuffer:
+        if isinstance(position, int):
+            position = slice(position, position + 1)
+        return self.plan.render(
+            window_bounds or slice(None, None),
+            names=names,
+            position=position,
+            duration=duration,
+        )
+
+    def play(
+        self,
+        window_bounds: slice | None = None,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        position: slice | int | None = None,
+        duration: timedelta = timedelta(seconds=0.5),
+    ):
+        self._player.play_raw(self.render(window_bounds, names, position, duration))
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            self._values[: len(self._labels)].copy(),
+            index=self._labels,
+            columns=list(self._keys),
+        )
+
+    def to_chart(self) -> AudibleChart:
+        """Snapshot the rows appended so far as a regular chart."""
+        return AudibleChart(
+            data=self.to_frame(),
+            config=self._config,
+            sample_rate=self._sample_rate,
+            frequency_range=self._frequency_range,
+            dtype=self._values.dtype,
+            player=self._player,
+        )
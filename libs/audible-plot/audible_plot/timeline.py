@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from audible_plot import kernels
+from audible_plot.generators import AudioBuffer
+from audible_plot.plan import RenderPlan
+
+
+def index_times(index: pd.Index) -> np.ndarray:
+    """Row times of a chart index: seconds for datetime and timedelta
+    indexes, the labels themselves for numeric ones, positions otherwise."""
+    if isinstance(index, pd.DatetimeIndex):
+        # Indexes may hold units other than nanoseconds
+        index = index - pd.Timestamp(0, tz=index.tz)
+    if isinstance(index, pd.TimedeltaIndex):
+        return index.total_seconds().to_numpy(dtype=np.float64)
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype=np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def _chained_phases(
+    onsets: np.ndarray, lengths: np.ndarray, frequencies: np.ndarray, sample_rate: float
+) -> np.ndarray:
+    """Starting phases of the events of one series: an event right after
+    another one continues its phase, and one after a gap starts at zero."""
+    held = np.cumsum(frequencies * lengths)
+    before = held - frequencies * lengths
+    joined = np.ones(len(onsets), bool)
+    joined[1:] = onsets[1:] == onsets[:-1] + lengths[:-1]
+    joined[:1] = False
+    # Phase accumulated before the first event of each chain
+    chain_start = np.maximum.accumulate(np.where(joined, 0, np.arange(len(onsets))))
+    return 2 * np.pi * (before - before[chain_start]) / sample_rate
+
+
+@dataclass(frozen=True, eq=False)
+class EventSchedule:
+    """The tones of a window laid out on its timeline, sorted by onset.
+
+    Onsets and lengths are in samples from the start of the window. Every
+    event holds one frequency with its own left and right gains, starting
+    at `phases` radians, so that contiguous events of a series join without
+    clicks.
+    """
+
+    onsets: np.ndarray
+    lengths: np.ndarray
+    frequencies: np.ndarray
+    phases: np.ndarray
+    gains: np.ndarray
+    wave_types: np.ndarray
+    size: int
+    sample_rate: float
+
+    def __len__(self) -> int:
+        return len(self.onsets)
+
+    @property
+    def active_samples(self) -> int:
+        """Samples written by the events, counting overlaps once per event."""
+        return int(self.lengths.sum())
+
+    def render(self) -> AudioBuffer:
+        sample = np.zeros((self.size, 2))
+        kernels.render_events(
+            sample,
+            self.onsets,
+            self.lengths,
+            self.frequencies,
+            self.phases,
+            self.gains,
+            self.wave_types,
+            float(self.sample_rate),
+        )
+        kernels.normalize(sample)
+        return sample  # type: ignore
+
+
+class TimelineRenderer:
+    """Render windows of a plan as events placed at their row times.
+
+    Each row becomes an event starting at its time scaled so that `period`
+    of data lasts `duration`, and sounding until the next row, for at most
+    `max_duration`. Rows of a run of a run-length encoded series are joined
+    into one event as long as they follow each other without a gap.
+    Irregular data keeps its rhythm and gaps stay silent, while rows whose
+    tone is silent (e.g. the unmet condition of a signal) are left out of
+    the schedule, so the render cost follows the audible time rather than
+    the number of rows.
+
+    Events are the flat tones given by the renderers' `tones`: transitions
+    between values are not rendered, and modulated voices and renderers
+    without tones cannot be scheduled. On regular rows, the output matches
+    `RenderPlan.render` for series without transitions.
+    """
+
+    def __init__(self, plan: RenderPlan, times: np.ndarray) -> None:
+        if len(times) != len(plan):
+            raise ValueError("There must be one time per plan row.")
+        self._plan = plan
+        self._times = np.asarray(times, dtype=np.float64)
+
+    @property
+    def plan(self) -> RenderPlan:
+        return self._plan
+
+    def schedule(
+        self,
+        bounds: slice,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(seconds=0.5),
+        period: float | None = None,
+        max_duration: timedelta | None = None,
+    ) -> EventSchedule:
+        """Lay out the selected series of a window as events.
+
+        `period` is the time span, in row time units, rendered over
+        `duration`; it defaults to the median step between rows of the
+        window. Events last `duration` at most unless `max_duration` is set.
+        The times of the window rows must be sorted.
+        """
+        plan = self._plan
+        window = range(len(plan))[bounds]
+        sample_rate = plan.sample_rate
+        sample_size = int(duration.total_seconds() * sample_rate)
+        longest = (
+            sample_size
+            if max_duration is None
+            else int(max_duration.total_seconds() * sample_rate)
+        )
+
+        times = self._times[bounds]
+        steps = np.diff(times)
+        if not np.all(steps >= 0):
+            raise ValueError("Laying out rows by time requires a sorted index.")
+        if period is None:
+            period = float(np.median(steps)) if len(steps) else 1.0
+        if not period > 0:
+            raise ValueError("The period of the rows must be positive.")
+        row_onsets = np.round((times - times[:1]) * (sample_size / period)).astype(
+            np.int64
+        )
+        row_ends = np.append(row_onsets[1:], row_onsets[-1:] + sample_size)
+        row_lengths = np.minimum(row_ends - row_onsets, longest)
+        # Rows sounding until the next one starts
+        joined = row_onsets[:-1] + row_lengths[:-1] == row_onsets[1:]
+
+        block = plan.values[bounds]
+        selected = plan.select(names)
+        related_range = None
+        if len(window) and any(not item.is_extra for item in selected):
+            related_range = plan.related_range(block, window)
+
+        events = []
+        for item in selected if len(window) else ():
+            if item.renderer.is_silent or item.voice is not None:
+                continue
+            if plan.modulators(item.key):
+                raise TypeError(
+                    f"Series {item.key!r} has a modulated voice and cannot be "
+                    "scheduled."
+                )
+            values, counts = plan.series_values(item, block, window)
+            tones = item.renderer.tones(
+                values,
+                plan.value_range(item, block, window, related_range),
+                item.frequency_range,
+            )
+            if tones is None:
+                raise TypeError(
+                    f"The renderer of {item.key!r} cannot be laid out as tones."
+                )
+
+            if counts is None:
+                run = np.arange(len(window))
+                onsets, lengths = row_onsets, row_lengths
+            else:
+                # Split runs into events of rows joined without gaps
+                run_last = np.cumsum(counts) - 1
+                breaks = np.zeros(len(window), bool)
+                breaks[run_last] = True
+                breaks[:-1] |= ~joined
+                last = np.flatnonzero(breaks)
+                first = np.concatenate(([0], last[:-1] + 1))
+                run = np.searchsorted(run_last, first)
+                onsets = row_onsets[first]
+                lengths = row_onsets[last] + row_lengths[last] - onsets
+            audible = (
+                (lengths > 0)
+                & np.isfinite(tones.frequency[run])
+                & np.all(np.isfinite(tones.gains[run]), axis=1)
+                & np.any(tones.gains[run] != 0, axis=1)
+            )
+            run = run[audible]
+            onsets = onsets[audible]
+            lengths = lengths[audible]
+            frequencies = tones.frequency[run]
+            events.append(
+                (
+                    onsets,
+                    lengths,
+                    frequencies,
+                    _chained_phases(onsets, lengths, frequencies, sample_rate),
+                    tones.gains[run],
+                    tones.wave_type[run],
+                )
+            )
+
+        if events:
+            columns = [np.concatenate(column) for column in zip(*events)]
+        else:
+            columns = [
+                np.empty(0, np.int64),
+                np.empty(0, np.int64),
+                np.empty(0),
+                np.empty(0),
+                np.empty((0, 2)),
+                np.empty(0, np.int64),
+            ]
+        order = np.argsort(columns[0], kind="stable")
+        return EventSchedule(
+            *(column[order] for column in columns),
+            size=int(row_ends[-1]) if len(row_ends) else 0,
+            sample_rate=sample_rate,
+        )
+
+    def render(
+        self,
+        bounds: slice,
+        names: Hashable | Sequence[Hashable] | Literal["all"] = "all",
+        duration: timedelta = timedelta(seconds=0.5),
+        period: float | None = None,
+        max_duration: timedelta | None = None,
+    ) -> AudioBuffer:
+        return self.schedule(bounds, names, duration, period, max_duration).render()
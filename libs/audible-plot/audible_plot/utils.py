@@ -3,6 +3,7 @@ from datetime import timedelta
 from typing import Sequence, override
 import numpy as np
 
+from . import kernels
 from .generators import AudioBuffer
 
 
@@ -91,19 +92,31 @@ class ValueMapper:
                 )
         return return_value
 
+    def map_values(self, values: np.ndarray) -> np.ndarray:
+        return kernels.map_linear(
+            np.asarray(values, dtype=np.float64),
+            float(self.source.min_value),
+            float(self.source.max_value),
+            float(self.target.min_value),
+            float(self.target.max_value),
+            -1.0 if self._limit_value is None else float(self._limit_value),
+        )
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.source!r}, {self.target!r}, {self._limit_value!r})"
 
 
-def pan_audio(buffer: AudioBuffer, pan: float) -> AudioBuffer:
-    left = buffer[:, 0]
-    right = buffer[:, 1]
-    return np.column_stack(
+def pan_gains(pan: float, volume: float = 1.0) -> np.ndarray:
+    return np.array(
         (
-            left * np.cos((1 + pan) * np.pi / 4),
-            right * np.sin((1 + pan) * np.pi / 4),
-        ),
-    )  # type: ignore
+            volume * np.cos((1 + pan) * np.pi / 4),
+            volume * np.sin((1 + pan) * np.pi / 4),
+        )
+    )
+
+
+def pan_audio(buffer: AudioBuffer, pan: float) -> AudioBuffer:
+    return buffer * pan_gains(pan)  # type: ignore
 
 
 def concat_samples(
@@ -111,25 +124,10 @@ def concat_samples(
     sample_rate: float,
     transition_duration: timedelta = timedelta(milliseconds=100),
 ) -> AudioBuffer:
-    final_buffer = np.ndarray((0, 2), np.float64)
-
     if len(buffers) == 0:
-        return final_buffer
-
-    # Concatenar cada buffer asegurando transiciones suaves
-    for buffer in buffers:
-        if len(final_buffer) == 0:
-            final_buffer = buffer
-            continue
-
-        final_buffer = np.vstack(
-            (
-                final_buffer,
-                buffer,
-            )
-        )
+        return np.ndarray((0, 2), np.float64)  # type: ignore
 
-    return final_buffer  # type: ignore
+    return np.concatenate(buffers)  # type: ignore
 
 
 def adjust_volume(buffer: AudioBuffer, volume: float) -> AudioBuffer:
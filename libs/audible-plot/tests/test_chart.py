@@ -0,0 +1,66 @@
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+
+
+def test_run_length_encoded_columns_are_not_stored_densely():
+    rng = np.random.default_rng(0)
+    size = 240
+    data = pd.DataFrame(
+        {
+            "close": np.cumsum(rng.normal(size=size)) + 100,
+            "signal": np.repeat(rng.integers(-1, 2, size=size // 12), 12),
+        },
+        index=pd.date_range("2024-01-01", periods=size, freq="min"),
+    )
+    chart = ap.AudibleChart(
+        data=data,
+        config=[
+            ap.SeriesConfig(
+                key=key,
+                renderer=ap.PitchDataRenderer(
+                    generator=ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+                ),
+            )
+            for key in data.columns
+        ],
+        frequency_range=ap.FixedRange(300, 800),
+    )
+    close, signal = chart.series
+
+    assert close.runs is None
+    assert signal.runs is not None
+    assert "signal" not in chart._data.columns
+    # The dense values are decoded from the runs on demand
+    pd.testing.assert_series_equal(signal.data, data["signal"])
+    assert len(signal) == size
+    assert chart.next_event("signal", 0) == data["signal"].to_numpy().nonzero()[0][0]
+    pd.testing.assert_frame_equal(
+        chart.resample("1h")._frame(),
+        data.resample("1h").agg({"close": "last", "signal": "last"}),
+    )
+
+
+def test_label_bounds_keep_their_step():
+    data = pd.DataFrame(
+        {"close": np.arange(48.0)},
+        index=pd.date_range("2024-01-01", periods=48, freq="h"),
+    )
+    chart = ap.AudibleChart(
+        data=data,
+        config=[
+            ap.SeriesConfig(
+                key="close",
+                renderer=ap.PitchDataRenderer(
+                    generator=ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+                ),
+            )
+        ],
+        frequency_range=ap.FixedRange(300, 800),
+    )
+    window = chart.window(
+        slice(pd.Timestamp("2024-01-01 06:00"), pd.Timestamp("2024-01-02"), 3)
+    )
+
+    assert window._position == slice(6, 24, 3)
+    assert list(window["close"][:]) == list(range(6, 24, 3))
@@ -0,0 +1,181 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+import pytest
+
+THREADS = 8
+
+
+@pytest.fixture(scope="module")
+def chart() -> ap.AudibleChart:
+    rng = np.random.default_rng(0)
+    size = 200
+    data = pd.DataFrame(
+        {
+            "close": np.cumsum(rng.normal(size=size)) + 100,
+            "sine": np.sin(np.arange(size) / 5),
+            "signal": np.repeat(rng.integers(-1, 2, size=size // 10), 10).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=size, freq="min"),
+    )
+
+    def pitch(wave_type, transitions=False):
+        return ap.PitchDataRenderer(
+            generator=ap.ToneGenerator(wave_type), enable_transitions=transitions
+        )
+
+    return ap.AudibleChart(
+        data=data,
+        config=[
+            ap.SeriesConfig(
+                key="close",
+                renderer=pitch(ap.ToneGenerator.WaveType.sine, transitions=True),
+            ),
+            ap.SeriesConfig(
+                key="sine",
+                renderer=pitch(ap.ToneGenerator.WaveType.triangle),
+                range=ap.FixedRange(-1, 1),
+            ),
+            ap.SeriesConfig(
+                key="signal",
+                renderer=ap.ConditionalRenderer(
+                    condition=lambda value: value > 0,
+                    renderer=pitch(ap.ToneGenerator.WaveType.square),
+                ),
+                range=ap.FixedRange(-1, 1),
+                run_length=True,
+            ),
+        ],
+        frequency_range=ap.FixedRange(300, 800),
+    )
+
+
+def _run_concurrently(jobs, repeat=1):
+    """Run every job `repeat` times in each of THREADS threads started
+    together, each thread in its own order, returning the results of
+    every job."""
+    barrier = threading.Barrier(THREADS)
+
+    def run(idx):
+        order = [(idx + step) % len(jobs) for step in range(len(jobs))] * repeat
+        barrier.wait()
+        return [(job, jobs[job]()) for job in order]
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(run, idx) for idx in range(THREADS)]
+        # Raises the first exception of the threads, if any
+        outputs = [future.result() for future in futures]
+    results = [[] for _ in jobs]
+    for output in outputs:
+        for job, result in output:
+            results[job].append(result)
+    return results
+
+
+def _window_jobs(chart):
+    duration = timedelta(milliseconds=20)
+    jobs = []
+    for start in range(0, 150, 25):
+        window = chart.window(slice(start, start + 60))
+        for names in ("all", "close", "signal", ["sine", "signal"]):
+            jobs.append(
+                lambda window=window, names=names: window.render(
+                    names, position=slice(10, 40), duration=duration
+                )
+            )
+        # Whole windows are rendered afresh without a sliding cache
+        jobs.append(lambda window=window: window.render(duration=duration))
+        jobs.append(lambda window=window: window.render_grains(duration=duration))
+        jobs.append(lambda window=window: window.render_timeline(duration=duration))
+    return jobs
+
+
+def test_window_renders_match_sequential(chart):
+    jobs = _window_jobs(chart)
+    expected = [job() for job in jobs]
+
+    for results, sequential in zip(_run_concurrently(jobs), expected):
+        for result in results:
+            assert np.array_equal(result, sequential)
+
+
+def test_lazy_chart_caches_are_built_once(chart):
+    def positive(values):
+        return values > 0
+
+    jobs = [
+        lambda: chart.events("signal", positive),
+        lambda: chart.events("sine", positive),
+        lambda: chart.resample("5min"),
+    ]
+
+    for results in _run_concurrently(jobs, repeat=2):
+        assert all(result is results[0] for result in results)
+
+
+def test_plan_renders_match_sequential(chart):
+    plan = chart._plan
+    duration = timedelta(milliseconds=20)
+    jobs = [
+        lambda bounds=slice(start, start + 60), names=names: plan.render(
+            bounds, names, duration=duration
+        )
+        for start in range(0, 140, 35)
+        for names in ("all", "close", "signal")
+    ]
+    expected = [job() for job in jobs]
+
+    for results, sequential in zip(_run_concurrently(jobs), expected):
+        for result in results:
+            assert np.array_equal(result, sequential)
+
+
+def test_shared_sliding_cache_matches_sequential(chart):
+    cache = chart.sliding_cache()
+    duration = timedelta(milliseconds=20)
+    bounds = slice(50, 150)
+    expected = cache.render(bounds, duration=duration)
+    assert np.array_equal(expected, chart._plan.render(bounds, duration=duration))
+
+    # Renders of the retained window reuse its audio while other threads
+    # drop it, and either way must give the same output
+    def render():
+        return cache.render(bounds, duration=duration)
+
+    def clear():
+        cache.clear()
+        return render()
+
+    rendered, cleared = _run_concurrently([render, clear], repeat=5)
+    for result in rendered + cleared:
+        assert np.array_equal(result, expected)
+
+
+def test_shared_sliding_cache_slides_concurrently(chart):
+    cache = chart.sliding_cache()
+    duration = timedelta(milliseconds=20)
+    bounds = [slice(start, start + 80) for start in range(0, 120, 10)]
+    jobs = [
+        lambda window=window: cache.render(window, duration=duration)
+        for window in bounds
+    ]
+
+    # Windows evict each other's audio, so their output depends on the
+    # order they run in; it must still be whole, normalized audio
+    for window, results in zip(bounds, _run_concurrently(jobs)):
+        fresh = chart._plan.render(window, duration=duration)
+        for result in results:
+            assert result.shape == fresh.shape
+            assert np.all(np.isfinite(result))
+            assert np.isclose(np.abs(result).max(), np.abs(fresh).max())
+
+    for window in bounds[:3]:
+        cache.clear()
+        assert np.array_equal(
+            cache.render(window, duration=duration),
+            chart._plan.render(window, duration=duration),
+        )
@@ -0,0 +1,154 @@
+import os
+from datetime import timedelta
+
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+import pytest
+from audible_plot.diskcache import AudioDiskCache
+
+
+def _audio(seed: int, size: int = 1000) -> np.ndarray:
+    return np.random.default_rng(seed).uniform(-1, 1, size=(size, 2))
+
+
+def test_key_is_stable():
+    parts = ("pitch", True, 0.5, np.arange(4, dtype=np.float64), None)
+    # Keys address entries written by earlier sessions, so they must not
+    # depend on the process computing them
+    assert AudioDiskCache.key(*parts) == (
+        "33f905bae619e591e883abb54427db28645f8c4f3e0861d9a3cb8af218742c97"
+    )
+    assert AudioDiskCache.key(*parts) == AudioDiskCache.key(*parts)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        ("pitch", True, 0.5, np.arange(4, dtype=np.float32), None),
+        ("pitch", True, 0.5, np.arange(4, dtype=np.float64).reshape(2, 2), None),
+        ("pitch", True, 0.5, np.arange(1, 5, dtype=np.float64), None),
+        ("pitch", False, 0.5, np.arange(4, dtype=np.float64), None),
+        ("pitch", True, 0.5, np.arange(4, dtype=np.float64)),
+    ],
+)
+def test_key_depends_on_every_part(other):
+    parts = ("pitch", True, 0.5, np.arange(4, dtype=np.float64), None)
+    assert AudioDiskCache.key(*other) != AudioDiskCache.key(*parts)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(tmp_path, compress):
+    cache = AudioDiskCache(tmp_path, compress=compress)
+    audio = _audio(0)
+    key = cache.key("audio")
+    assert cache.get(key) is None
+
+    cache.put(key, audio)
+    entry = cache.get(key)
+    assert entry is not None
+    assert entry.dtype == np.float32
+    np.testing.assert_array_equal(entry, audio.astype(np.float32))
+    if compress:
+        assert not isinstance(entry, np.memmap)
+    else:
+        assert isinstance(entry, np.memmap)
+        assert not entry.flags.writeable
+
+
+def test_eviction_keeps_recent_entries_under_max_bytes(tmp_path):
+    probe = AudioDiskCache(tmp_path / "probe")
+    probe.put(probe.key(), _audio(0))
+    entry_size = probe.size
+    cache = AudioDiskCache(tmp_path / "cache", max_bytes=3 * entry_size)
+    keys = [cache.key(idx) for idx in range(3)]
+    for idx, key in enumerate(keys):
+        cache.put(key, _audio(idx))
+        # Entries are used in order, the first one long ago
+        os.utime(cache._path(key), (1000 + idx, 1000 + idx))
+    assert cache.size == 3 * entry_size
+
+    # Reading the first entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+    cache.put(cache.key(3), _audio(3))
+
+    assert cache.size <= 3 * entry_size
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) is not None for key in (keys[0], keys[2]))
+    assert cache._read_total() == cache.size
+
+
+def test_total_size_is_tracked_without_scanning(tmp_path, monkeypatch):
+    cache = AudioDiskCache(tmp_path)
+    cache.put(cache.key(0), _audio(0))
+
+    def scan():
+        raise AssertionError("The cache directory was scanned.")
+
+    monkeypatch.setattr(cache, "_entries", scan)
+    for idx in range(1, 5):
+        cache.put(cache.key(idx), _audio(idx))
+    monkeypatch.undo()
+    assert cache._read_total() == cache.size
+
+    cache.clear()
+    assert cache.size == 0
+    assert cache._read_total() == 0
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("damage", ["truncate", "garbage", "empty"])
+def test_damaged_entries_are_misses(tmp_path, compress, damage):
+    cache = AudioDiskCache(tmp_path, compress=compress)
+    key = cache.key("audio")
+    cache.put(key, _audio(0))
+    path = cache._path(key)
+    content = path.read_bytes()
+    path.write_bytes(
+        {
+            "truncate": content[: len(content) // 2],
+            "garbage": os.urandom(len(content)),
+            "empty": b"",
+        }[damage]
+    )
+
+    assert cache.get(key) is None
+    # The entry is written again by the next render
+    cache.put(key, _audio(0))
+    assert cache.get(key) is not None
+
+
+def test_cached_renders_match_fresh_ones(tmp_path):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "close": np.cumsum(rng.normal(size=60)) + 100,
+            "volume": rng.uniform(1, 2, size=60),
+        }
+    )
+    generator = ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+
+    def chart(cache):
+        return ap.AudibleChart(
+            data=data,
+            config=[
+                ap.SeriesConfig(
+                    key="close", renderer=ap.PitchDataRenderer(generator=generator)
+                ),
+                ap.SeriesConfig(
+                    key="volume",
+                    renderer=ap.AmplitudeDataRenderer(generator=generator),
+                    voice="close",
+                ),
+            ],
+            frequency_range=ap.FixedRange(300, 800),
+            cache=cache,
+        )
+
+    duration = timedelta(milliseconds=20)
+    fresh = chart(None).plan.render(slice(5, 50), duration=duration)
+    cache = AudioDiskCache(tmp_path)
+    for _ in range(2):
+        cached = chart(cache).plan.render(slice(5, 50), duration=duration)
+        np.testing.assert_allclose(cached, fresh, atol=1e-6)
+    assert cache.size
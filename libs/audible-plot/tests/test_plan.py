@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _chart(run_length: bool | None) -> ap.AudibleChart:
+    rng = np.random.default_rng(0)
+    size = 120
+    data = pd.DataFrame(
+        {
+            "close": np.cumsum(rng.normal(size=size)) + 100,
+            "level": np.repeat(rng.normal(size=size // 10), 10) + 100,
+            "signal": np.repeat(rng.integers(-1, 2, size=size // 8), 8).astype(float),
+        }
+    )
+
+    def pitch():
+        return ap.PitchDataRenderer(
+            generator=ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+        )
+
+    return ap.AudibleChart(
+        data=data,
+        config=[
+            ap.SeriesConfig(key="close", renderer=pitch()),
+            # Related step-like series, taking part in the shared range
+            ap.SeriesConfig(key="level", renderer=pitch(), run_length=run_length),
+            ap.SeriesConfig(
+                key="signal",
+                renderer=ap.ConditionalRenderer(
+                    condition=lambda value: value > 0, renderer=pitch()
+                ),
+                run_length=run_length,
+                range=ap.FixedRange(-1, 1),
+            ),
+        ],
+        frequency_range=ap.FixedRange(300, 800),
+    )
+
+
+@pytest.mark.parametrize(
+    "bounds", [slice(0, 100, 2), slice(5, 110, 3), slice(None, None, -1)]
+)
+@pytest.mark.parametrize("names", ["all", "close", "signal"])
+def test_stepped_window_of_run_length_series(bounds, names):
+    encoded = _chart(None)
+    dense = _chart(False)
+    assert all(
+        encoded.plan.select(key)[0].runs is not None for key in ("level", "signal")
+    )
+
+    duration = timedelta(milliseconds=20)
+    np.testing.assert_allclose(
+        encoded.window(bounds).render(names, duration=duration),
+        dense.window(bounds).render(names, duration=duration),
+        atol=1e-9,
+    )
@@ -0,0 +1,80 @@
+import os
+from datetime import timedelta
+from multiprocessing.shared_memory import SharedMemory
+
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _shared_blocks() -> set[str]:
+    if not os.path.isdir("/dev/shm"):
+        return set()
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+@pytest.fixture(scope="module")
+def plan() -> ap.RenderPlan:
+    rng = np.random.default_rng(0)
+    size = 160
+    data = pd.DataFrame(
+        {
+            "close": np.cumsum(rng.normal(size=size)) + 100,
+            "open": np.cumsum(rng.normal(size=size)) + 100,
+            "sine": np.sin(np.arange(size) / 5),
+            "signal": np.repeat(rng.integers(-1, 2, size=size // 10), 10).astype(float),
+            "pan": rng.uniform(-1, 1, size=size),
+        }
+    )
+    generator = ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+
+    def pitch(**kwargs):
+        return ap.PitchDataRenderer(generator=generator, **kwargs)
+
+    return ap.AudibleChart(
+        data=data,
+        config=[
+            # Related mono series, split into row chunks
+            ap.SeriesConfig(key="close", renderer=pitch(enable_transitions=True)),
+            ap.SeriesConfig(key="open", renderer=pitch(pan=-0.5)),
+            ap.SeriesConfig(
+                key="sine", renderer=pitch(pan=0.5), range=ap.FixedRange(-1, 1)
+            ),
+            # Conditional series, run-length encoded
+            ap.SeriesConfig(
+                key="signal",
+                renderer=ap.ConditionalRenderer(
+                    condition=lambda value: value > 0, renderer=pitch()
+                ),
+                range=ap.FixedRange(-1, 1),
+                run_length=True,
+            ),
+            # Stereo series, rendered whole
+            ap.SeriesConfig(
+                key="pan",
+                renderer=ap.PanDataRenderer(generator=generator),
+                range=ap.FixedRange(-1, 1),
+            ),
+        ],
+        frequency_range=ap.FixedRange(300, 800),
+    ).plan
+
+
+def test_renders_match_the_plan(plan):
+    duration = timedelta(milliseconds=20)
+    blocks = _shared_blocks()
+    with ap.ProcessPoolRenderer(plan, processes=3) as pool:
+        name = pool._columns.name
+        for bounds in (slice(None), slice(7, 131), slice(40, 45), slice(0, 100, 3)):
+            for names in ("all", "close", "signal", "pan", ["sine", "signal"]):
+                np.testing.assert_allclose(
+                    pool.render(bounds, names, duration=duration),
+                    plan.render(bounds, names, duration=duration),
+                    atol=1e-7,
+                )
+
+    # The columns and every output buffer are released
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+    assert _shared_blocks() == blocks
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="module")
+def plan() -> ap.RenderPlan:
+    size = 200
+    data = pd.DataFrame(
+        {
+            "sine": np.sin(np.arange(size) / 7),
+            "cosine": np.cos(np.arange(size) / 5),
+        }
+    )
+    generator = ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+    return ap.AudibleChart(
+        data=data,
+        config=[
+            # Fixed ranges, so that overlapping windows reuse their audio
+            ap.SeriesConfig(
+                key="sine",
+                renderer=ap.PitchDataRenderer(
+                    generator=generator, enable_transitions=True, pan=-0.5
+                ),
+                range=ap.FixedRange(-1, 1),
+            ),
+            ap.SeriesConfig(
+                key="cosine",
+                renderer=ap.PitchDataRenderer(generator=generator, pan=0.5),
+                range=ap.FixedRange(-1, 1),
+            ),
+        ],
+        frequency_range=ap.FixedRange(300, 800),
+    ).plan
+
+
+def _row_levels(sample: np.ndarray, rows: int) -> np.ndarray:
+    """Root mean square of each row segment, per channel."""
+    return np.sqrt(np.mean(sample.reshape(rows, -1, 2) ** 2, axis=1))
+
+
+@pytest.mark.parametrize("names", ["sine", "cosine"])
+@pytest.mark.parametrize("step", [1, 7, -3])
+def test_slid_windows_match_fresh_renders(plan, names, step):
+    cache = ap.SlidingRenderCache(plan)
+    duration = timedelta(milliseconds=20)
+    starts = range(60, 120, step) if step > 0 else range(120, 60, step)
+
+    reused = False
+    for start in starts:
+        bounds = slice(start, start + 60)
+        slid = cache.render(bounds, names, duration=duration)
+        fresh = plan.render(bounds, names, duration=duration)
+        # Reused audio is shifted in phase, which keeps its shape and level
+        assert slid.shape == fresh.shape
+        np.testing.assert_allclose(np.abs(slid).max(), np.abs(fresh).max(), rtol=1e-3)
+        np.testing.assert_allclose(
+            _row_levels(slid, 60), _row_levels(fresh, 60), rtol=0.05
+        )
+        # and joins the synthesized rows without jumps
+        assert (
+            np.abs(np.diff(slid, axis=0)).max()
+            <= 1.01 * np.abs(np.diff(fresh, axis=0)).max()
+        )
+        reused |= not np.array_equal(slid, fresh)
+
+        # Slide on from a fresh render of the window
+        cache.clear()
+        assert np.array_equal(cache.render(bounds, names, duration=duration), fresh)
+    assert reused
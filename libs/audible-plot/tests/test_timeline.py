@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+import audible_plot as ap
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _chart(data: pd.Series, run_length: bool) -> ap.AudibleChart:
+    return ap.AudibleChart(
+        data=data.to_frame("signal"),
+        config=[
+            ap.SeriesConfig(
+                key="signal",
+                renderer=ap.PitchDataRenderer(
+                    generator=ap.ToneGenerator(ap.ToneGenerator.WaveType.sine)
+                ),
+                range=ap.FixedRange(0, 3),
+                run_length=run_length,
+            )
+        ],
+        frequency_range=ap.FixedRange(300, 600),
+    )
+
+
+@pytest.mark.parametrize(
+    ("times", "values"),
+    [
+        # One run of rows with a long gap in the middle
+        ([0, 1, 2, 3, 100, 101, 102, 103], [1, 1, 1, 1, 1, 1, 1, 1]),
+        # Runs split by gaps, both at and inside their boundaries
+        (
+            [0, 1, 2, 5, 6, 7, 8, 20, 21, 22, 23, 24],
+            [1, 1, 2, 2, 2, 3, 3, 3, 0, 0, 1, 1],
+        ),
+    ],
+)
+@pytest.mark.parametrize("max_duration", [None, timedelta(seconds=0.25)])
+def test_run_length_schedule_matches_dense(times, values, max_duration):
+    data = pd.Series(
+        np.array(values, dtype=np.float64),
+        index=pd.to_datetime(times, unit="s"),
+    )
+    schedules = [
+        _chart(data, run_length)
+        .window(slice(None))
+        .schedule(period=timedelta(seconds=1), max_duration=max_duration)
+        for run_length in (False, True)
+    ]
+    dense, encoded = schedules
+
+    assert encoded.size == dense.size
+    # Rows of a run are joined into events covering the same samples
+    assert len(encoded) <= len(dense)
+    assert encoded.active_samples == dense.active_samples
+    for schedule in schedules:
+        assert np.all(schedule.lengths > 0)
+    np.testing.assert_allclose(encoded.render(), dense.render(), atol=1e-9)
+
+
+def test_unsorted_rows_are_rejected():
+    data = pd.Series(np.ones(6), index=pd.to_datetime([0, 10, 5, 20, 15, 30], unit="s"))
+    window = _chart(data, run_length=False).window(slice(None))
+
+    with pytest.raises(ValueError, match="sorted"):
+        window.schedule(period=timedelta(seconds=5))